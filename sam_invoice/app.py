@@ -3,25 +3,29 @@
 import os
 import signal
 import sys
+from functools import partial
 from pathlib import Path
 
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QSettings, QTimer
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
+    QSplitter,
     QStackedWidget,
     QVBoxLayout,
     QWidget,
 )
+from sqlalchemy.exc import OperationalError
 
 from sam_invoice.models import database
 from sam_invoice.style_manager import setup_application_style
-from sam_invoice.ui.customer_view import CustomerView
-from sam_invoice.ui.invoices_view import InvoicesView
 from sam_invoice.ui.menu_bar import create_menu_bar
-from sam_invoice.ui.products_view import ProductsView
 from sam_invoice.ui.toolbar import create_toolbar, set_active_toolbar_action
 
+# Keys (in the "splitters" settings group) holding each view's splitter state, by toolbar index
+_SPLITTER_KEYS = {0: "customer_view", 1: "products_view"}
+
 
 class MainWindow(QMainWindow):
     """Sam Invoice application main window."""
@@ -30,21 +34,35 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle("Sam Invoice")
 
-        # Initialize settings
-        self.settings = QSettings("SamInvoice", "SamInvoice")
+        # Initialize settings from the organization/application names set in
+        # main() (flushed to disk when the application quits)
+        self.settings = QSettings()
+        QApplication.instance().aboutToQuit.connect(self.settings.sync)
 
-        # Load last opened database or use default
+        # Load last opened database or use default. The last one is opened
+        # without being created, so a file that is gone fails here, before
+        # any view can search it, instead of costing a separate stat.
         last_db = self.settings.value("last_database", None)
-        if last_db and Path(last_db).exists():
-            self.current_db_path = Path(last_db)
+        self.current_db_path = None
+        if last_db:
+            try:
+                database.db_manager.set_database_path(last_db, create=False)
+                self.current_db_path = Path(last_db)
+            except OperationalError:
+                pass
+        if self.current_db_path is None:
+            self.current_db_path = database.default_db_path()
             database.db_manager.set_database_path(self.current_db_path)
-        else:
-            self.current_db_path = database.DEFAULT_DB_PATH
 
         self._update_window_title()
 
         # === Menu Bar ===
-        create_menu_bar(self)
+        # The macOS global menu must be there at launch; elsewhere it is drawn
+        # inside the window frame, so build it right after the first paint
+        if sys.platform == "darwin":
+            create_menu_bar(self)
+        else:
+            QTimer.singleShot(0, partial(create_menu_bar, self))
 
         central_widget = QWidget()
         main_layout = QVBoxLayout(central_widget)
@@ -54,32 +72,30 @@ class MainWindow(QMainWindow):
         self.addToolBar(toolbar)
 
         # === Stacked area for views ===
-        self.stack = QStackedWidget()
-
-        # Customers view (Home)
-        self._customer_view = CustomerView()
-        self.stack.addWidget(self._customer_view)
+        # View modules pull in the models and qtawesome: import them only once
+        # the QApplication exists and the window is being built
+        from sam_invoice.ui.customer_view import CustomerView
+        from sam_invoice.ui.invoices_view import InvoicesView
+        from sam_invoice.ui.products_view import ProductsView
 
-        # Products view
-        self._products_view = ProductsView()
-        self.stack.addWidget(self._products_view)
+        self.stack = QStackedWidget()
 
-        # Invoices view
-        self._invoices_view = InvoicesView()
-        self.stack.addWidget(self._invoices_view)
+        # Views are built on first activation, only Home is built before show()
+        self._view_factories = {0: CustomerView, 1: ProductsView, 2: InvoicesView}
+        self._views: dict[int, QWidget] = {}
+        # Splitters (by settings key) and cleanup callbacks of the built views
+        self._view_splitters: dict[str, QSplitter] = {}
+        self._view_cleanups: list = []
+        self._get_view(0)
 
         main_layout.addWidget(self.stack)
 
         self.setCentralWidget(central_widget)
 
         # === Toolbar action connections ===
-        self.act_home.triggered.connect(lambda: set_active_toolbar_action(self, self.act_home) or self._show_view(0))
-        self.act_products.triggered.connect(
-            lambda: set_active_toolbar_action(self, self.act_products) or self._show_view(1)
-        )
-        self.act_invoices.triggered.connect(
-            lambda: set_active_toolbar_action(self, self.act_invoices) or self._show_view(2)
-        )
+        self.act_home.triggered.connect(partial(self._on_nav, self.act_home, 0))
+        self.act_products.triggered.connect(partial(self._on_nav, self.act_products, 1))
+        self.act_invoices.triggered.connect(partial(self._on_nav, self.act_invoices, 2))
 
         # Activate Home by default
         set_active_toolbar_action(self, self.act_home)
@@ -87,9 +103,36 @@ class MainWindow(QMainWindow):
         # Restore window geometry and state
         self._restore_window_state()
 
+    def _get_view(self, index: int) -> QWidget:
+        """Return the view for a toolbar index, creating it on first use."""
+        view = self._views.get(index)
+        if view is None:
+            view = self._view_factories[index]()
+            self._views[index] = view
+            self.stack.addWidget(view)
+
+            cleanup = getattr(view, "cleanup", None)
+            if cleanup is not None:
+                self._view_cleanups.append(cleanup)
+
+            # Restore splitter sizes saved for this view
+            key = _SPLITTER_KEYS.get(index)
+            splitter = getattr(view, "_splitter", None)
+            if key and splitter is not None:
+                self._view_splitters[key] = splitter
+                splitter_state = self.settings.value(f"splitters/{key}")
+                if splitter_state:
+                    splitter.restoreState(splitter_state)
+        return view
+
+    def _on_nav(self, action, index: int, _checked: bool = False):
+        """Activate a toolbar action and display the matching view."""
+        set_active_toolbar_action(self, action)
+        self._show_view(index)
+
     def _show_view(self, index: int):
         """Display a specific view in the stack."""
-        self.stack.setCurrentIndex(index)
+        self.stack.setCurrentWidget(self._get_view(index))
 
     def _update_window_title(self):
         """Update window title with current database name."""
@@ -98,22 +141,20 @@ class MainWindow(QMainWindow):
 
     def _reload_views(self):
         """Reload all views with new database."""
-        # Reload customers view
-        if hasattr(self._customer_view, "reload_items"):
-            self._customer_view.reload_items()
-
-        # Reload products view
-        if hasattr(self._products_view, "reload_items"):
-            self._products_view.reload_items()
-
-        # Reload invoices view
-        if hasattr(self._invoices_view, "refresh"):
-            self._invoices_view.refresh()
+        # Views not built yet will load from the new database when first shown
+        for view in self._views.values():
+            view.reload_items()
 
     def _restore_window_state(self):
         """Restore window geometry and state from settings."""
+        self.settings.beginGroup("window")
+        geometry = self.settings.value("geometry")
+        window_state = self.settings.value("state")
+        was_fullscreen = self.settings.value("fullscreen", False, type=bool)
+        was_maximized = self.settings.value("maximized", False, type=bool)
+        self.settings.endGroup()
+
         # Restore window geometry first
-        geometry = self.settings.value("window/geometry")
         if geometry:
             self.restoreGeometry(geometry)
         else:
@@ -121,50 +162,36 @@ class MainWindow(QMainWindow):
             self.resize(1200, 800)
 
         # Restore window state (toolbars, dockwidgets, etc.)
-        window_state = self.settings.value("window/state")
         if window_state:
             self.restoreState(window_state)
 
         # Check if was in fullscreen
-        was_fullscreen = self.settings.value("window/fullscreen", False, type=bool)
         if was_fullscreen:
             self.showFullScreen()
         else:
             # Check if was maximized (only if not fullscreen)
-            was_maximized = self.settings.value("window/maximized", False, type=bool)
             if was_maximized:
                 self.showMaximized()
 
-        # Restore splitter sizes for customer view
-        customer_splitter_state = self.settings.value("splitters/customer_view")
-        if customer_splitter_state and hasattr(self._customer_view, "_splitter"):
-            self._customer_view._splitter.restoreState(customer_splitter_state)
-
-        # Restore splitter sizes for products view
-        products_splitter_state = self.settings.value("splitters/products_view")
-        if products_splitter_state and hasattr(self._products_view, "_splitter"):
-            self._products_view._splitter.restoreState(products_splitter_state)
-
     def _save_window_state(self):
-        """Save window geometry and state to settings."""
-        # Save window geometry
-        self.settings.setValue("window/geometry", self.saveGeometry())
-
-        # Save window state
-        self.settings.setValue("window/state", self.saveState())
-
-        # Save if window is fullscreen
-        self.settings.setValue("window/fullscreen", self.isFullScreen())
-
-        # Save if window is maximized (only relevant if not fullscreen)
-        self.settings.setValue("window/maximized", self.isMaximized())
-
-        # Save splitter states
-        if hasattr(self._customer_view, "_splitter"):
-            self.settings.setValue("splitters/customer_view", self._customer_view._splitter.saveState())
-
-        if hasattr(self._products_view, "_splitter"):
-            self.settings.setValue("splitters/products_view", self._products_view._splitter.saveState())
+        """Save window geometry and state to settings.
+
+        Values go to the settings cache; the backing store is synced when the
+        application quits rather than on every close.
+        """
+        self.settings.beginGroup("window")
+        self.settings.setValue("geometry", self.saveGeometry())
+        self.settings.setValue("state", self.saveState())
+        self.settings.setValue("fullscreen", self.isFullScreen())
+        # Maximized is only relevant if not fullscreen
+        self.settings.setValue("maximized", self.isMaximized())
+        self.settings.endGroup()
+
+        # Save splitter states (views never opened keep their previous state)
+        self.settings.beginGroup("splitters")
+        for key, splitter in self._view_splitters.items():
+            self.settings.setValue(key, splitter.saveState())
+        self.settings.endGroup()
 
     def closeEvent(self, event):
         """Clean up resources before closing the application."""
@@ -172,9 +199,8 @@ class MainWindow(QMainWindow):
         self._save_window_state()
 
         # Cleanup threads from all views
-        for view in [self._customer_view, self._products_view, self._invoices_view]:
-            if hasattr(view, "cleanup"):
-                view.cleanup()
+        for cleanup in self._view_cleanups:
+            cleanup()
 
         super().closeEvent(event)
 
@@ -190,8 +216,12 @@ def main():
 
     app = QApplication(sys.argv)
 
-    # Set application metadata
-    app.setApplicationName("Sam Invoice")
+    # Give icon pixmaps room in Qt's shared cache (limit in KB, default 10 MB)
+    QPixmapCache.setCacheLimit(64 * 1024)
+
+    # Set application metadata (organization and application names also
+    # locate the default QSettings store, keep them as they were)
+    app.setApplicationName("SamInvoice")
     app.setApplicationDisplayName("Sam Invoice")
     app.setOrganizationName("SamInvoice")
     app.setOrganizationDomain("sam-invoice.app")
@@ -250,9 +280,10 @@ def _setup_signal_handlers(app: QApplication) -> None:
             signal_sock[0].recv(1)
         except (OSError, BlockingIOError):
             pass
-        print("\nClosing application...")
-        # Use Qt's quit for clean shutdown
-        app.quit()
+        print("\nClosing application...", flush=True)
+        # Exit immediately: app.quit() runs closeEvent, view cleanups and thread
+        # joins, which can stall. Window state is therefore not saved on Ctrl-C.
+        os._exit(0)
 
     notifier.activated.connect(handle_signal)
 
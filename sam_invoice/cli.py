@@ -1,22 +1,35 @@
 """Command line interface for Sam Invoice."""
 
 import json
+import queue
+import re
+import threading
+from collections.abc import Iterable, Iterator
 from datetime import date
+from itertools import batched
 from pathlib import Path
 from typing import Annotated
 
 import typer
 from rich.console import Console
-from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
 
-from sam_invoice.models.crud_customer import customer_crud
-from sam_invoice.models.crud_invoice import invoice_crud
-from sam_invoice.models.crud_product import product_crud
 from sam_invoice.models.database import db_manager
 
 console = Console()
 app = typer.Typer()
 
+# Default fixtures directory at project root
+_FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+# Rows inserted per transaction when loading fixtures
+_BATCH_SIZE = 10_000
+
+# Batches prepared ahead of the inserts
+_PREFETCH_BATCHES = 4
+
+# Line breaks of a customer snapshot, with the surrounding whitespace
+_NEWLINE_RE = re.compile(r"\s*\n\s*")
+
 # Database commands group
 db_app = typer.Typer()
 app.add_typer(db_app, name="db")
@@ -25,6 +38,10 @@ app.add_typer(db_app, name="db")
 fixtures_app = typer.Typer()
 app.add_typer(fixtures_app, name="fixtures")
 
+# Invoices commands group
+invoices_app = typer.Typer()
+app.add_typer(invoices_app, name="invoices")
+
 
 @db_app.command("init")
 def initdb(db_path: Annotated[Path, typer.Option("--db", help="Path to database file")] = None):
@@ -39,20 +56,23 @@ def initdb(db_path: Annotated[Path, typer.Option("--db", help="Path to database
 def load_customers(
     path: Annotated[Path, typer.Argument(help="Path to customers JSON file")] = None,
     db_path: Annotated[Path, typer.Option("--db", help="Path to database file")] = None,
-    verbose: bool = True,
+    verbose: bool = False,
 ):
     """Load customers from a JSON fixtures file into the database.
 
     Default file: `fixtures/customers.json` at project root.
     """
+    from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
+
+    from sam_invoice.models.crud_customer import customer_crud
+
     # Set database path if provided
     if db_path:
         db_manager.set_database_path(db_path)
 
     # Determine fixtures file path
     if path is None:
-        pkg_dir = Path(__file__).resolve().parent.parent
-        path = pkg_dir / "fixtures" / "customers.json"
+        path = _FIXTURES_DIR / "customers.json"
 
     if not path.exists():
         typer.echo(f"Fixtures file not found: {path}")
@@ -62,40 +82,22 @@ def load_customers(
     db_manager.init_db()
 
     # Load JSON data
-    with path.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    items = _read_fixtures(path)
+
+    # Column values of each customer (no duplicate check)
+    rows = ({"name": item.get("name"), "address": item.get("address"), "email": item.get("email")} for item in items)
 
     # Import with progress bar
-    created = 0
-    errors = 0
     with Progress(
         TextColumn("{task.description}"),
         BarColumn(),
         "[progress.percentage]{task.percentage:>3.0f}%",
         TimeElapsedColumn(),
         console=console,
+        refresh_per_second=4,
     ) as progress:
-        task = progress.add_task("Importing customers", total=len(data))
-
-        for item in data:
-            name = item.get("name")
-            address = item.get("address")
-            email = item.get("email")
-
-            try:
-                # Create customer (no duplicate check)
-                cust = customer_crud.create(name=name, address=address, email=email)
-                if cust:
-                    created += 1
-                    progress.advance(task)
-                    if verbose:
-                        console.print(f"Created customer {cust.id} - {cust.name}")
-                else:
-                    progress.advance(task)
-            except Exception as e:
-                errors += 1
-                progress.advance(task)
-                console.print(f"[yellow]Warning: Failed to create customer '{name}': {e}[/yellow]")
+        task = progress.add_task("Importing customers", total=len(items))
+        created, errors = _insert_in_batches(customer_crud, rows, progress, task, "customer", "name", verbose)
 
     if errors > 0:
         console.print(f"Loaded {created} customers from {path} ({errors} errors)", style="yellow")
@@ -107,20 +109,23 @@ def load_customers(
 def load_products(
     path: Annotated[Path, typer.Argument(help="Path to products JSON file")] = None,
     db_path: Annotated[Path, typer.Option("--db", help="Path to database file")] = None,
-    verbose: bool = True,
+    verbose: bool = False,
 ):
     """Load products from a JSON fixtures file into the database.
 
     Default file: `fixtures/products.json` at project root.
     """
+    from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
+
+    from sam_invoice.models.crud_product import product_crud
+
     # Set database path if provided
     if db_path:
         db_manager.set_database_path(db_path)
 
     # Determine fixtures file path
     if path is None:
-        pkg_dir = Path(__file__).resolve().parent.parent
-        path = pkg_dir / "fixtures" / "products.json"
+        path = _FIXTURES_DIR / "products.json"
 
     if not path.exists():
         typer.echo(f"Fixtures file not found: {path}")
@@ -130,42 +135,31 @@ def load_products(
     db_manager.init_db()
 
     # Load JSON data
-    with path.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    items = _read_fixtures(path)
+
+    # Column values of each product
+    rows = (
+        {
+            "reference": item.get("reference"),
+            "name": item.get("name"),
+            "price": item.get("price", 0.0),
+            "stock": item.get("stock", 0),
+            "sold": item.get("sold", 0),
+        }
+        for item in items
+    )
 
     # Import with progress bar
-    created = 0
-    errors = 0
     with Progress(
         TextColumn("{task.description}"),
         BarColumn(),
         "[progress.percentage]{task.percentage:>3.0f}%",
         TimeElapsedColumn(),
         console=console,
+        refresh_per_second=4,
     ) as progress:
-        task = progress.add_task("Importing products", total=len(data))
-
-        for item in data:
-            reference = item.get("reference")
-            name = item.get("name")
-            price = item.get("price", 0.0)
-            stock = item.get("stock", 0)
-            sold = item.get("sold", 0)
-
-            try:
-                # Create or update product (handled by CRUD)
-                product = product_crud.create(reference=reference, name=name, price=price, stock=stock, sold=sold)
-                if product:
-                    created += 1
-                    progress.advance(task)
-                    if verbose:
-                        console.print(f"Processed product {product.id} - {product.reference}")
-                else:
-                    progress.advance(task)
-            except Exception as e:
-                errors += 1
-                progress.advance(task)
-                console.print(f"[yellow]Warning: Failed to process product '{reference}': {e}[/yellow]")
+        task = progress.add_task("Importing products", total=len(items))
+        created, errors = _insert_in_batches(product_crud, rows, progress, task, "product", "reference", verbose)
 
     if errors > 0:
         console.print(f"Loaded {created} products from {path} ({errors} errors)", style="yellow")
@@ -177,20 +171,23 @@ def load_products(
 def load_invoices(
     path: Annotated[Path, typer.Argument(help="Path to invoices JSON file")] = None,
     db_path: Annotated[Path, typer.Option("--db", help="Path to database file")] = None,
-    verbose: bool = True,
+    verbose: bool = False,
 ):
     """Load invoices from a JSON fixtures file into the database.
 
     Default file: `fixtures/invoices.json` at project root.
     """
+    from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
+
+    from sam_invoice.models.crud_invoice import invoice_crud
+
     # Set database path if provided
     if db_path:
         db_manager.set_database_path(db_path)
 
     # Determine fixtures file path
     if path is None:
-        pkg_dir = Path(__file__).resolve().parent.parent
-        path = pkg_dir / "fixtures" / "invoices.json"
+        path = _FIXTURES_DIR / "invoices.json"
 
     if not path.exists():
         typer.echo(f"Fixtures file not found: {path}")
@@ -200,8 +197,7 @@ def load_invoices(
     db_manager.init_db()
 
     # Load JSON data
-    with path.open("r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    items = _read_fixtures(path)
 
     # Import with progress bar
     created = 0
@@ -212,67 +208,26 @@ def load_invoices(
         "[progress.percentage]{task.percentage:>3.0f}%",
         TimeElapsedColumn(),
         console=console,
+        refresh_per_second=4,
     ) as progress:
-        task = progress.add_task("Importing invoices", total=len(data))
-
-        for item in data:
-            reference = item.get("ref")
-            date_str = item.get("date")
-            due_date_str = item.get("echeance")
-            customer_raw = item.get("client", "")
-
-            # Parse customer name and address
-            customer_lines = customer_raw.strip().split("\n")
-            customer_name = customer_lines[0].strip() if customer_lines else "Unknown"
-            customer_address = "\n".join(line.strip() for line in customer_lines[1:] if line.strip())
-
-            # Parse totals
-            subtotal = float(item.get("sumHT", 0))
-            tax = float(item.get("sumTVA", 0))
-            total = float(item.get("sumTTC", 0))
-
-            # Parse items
-            achats = item.get("achats", [])
-            items_data = []
-            for achat in achats:
-                items_data.append(
-                    {
-                        "product_name": achat.get("desc", ""),
-                        "quantity": int(achat.get("quantite", 1)),
-                        "unit_price": float(achat.get("puht", 0)),
-                        "total_price": float(achat.get("pht", 0)),
-                    }
-                )
-
-            try:
-                # Parse dates
-                inv_date = date.fromisoformat(date_str) if date_str else date.today()
-                due_date = date.fromisoformat(due_date_str) if due_date_str else None
-
-                # Create invoice
-                inv = invoice_crud.create(
-                    reference=reference,
-                    date=inv_date,
-                    due_date=due_date,
-                    customer_name=customer_name,
-                    customer_address=customer_address,
-                    subtotal=subtotal,
-                    tax=tax,
-                    total=total,
-                    items_data=items_data,
-                )
-
-                if inv:
-                    created += 1
-                    progress.advance(task)
-                    if verbose:
-                        console.print(f"Created invoice {inv.reference} - {inv.customer_name}")
-                else:
+        task = progress.add_task("Importing invoices", total=len(items))
+
+        def parsed_rows():
+            nonlocal errors
+            today = date.today()
+            for item in items:
+                try:
+                    yield _invoice_row(item, today)
+                except Exception as e:
+                    errors += 1
                     progress.advance(task)
-            except Exception as e:
-                errors += 1
-                progress.advance(task)
-                console.print(f"[yellow]Warning: Failed to create invoice '{reference}': {e}[/yellow]")
+                    console.print(f"[yellow]Warning: Failed to create invoice '{item.get('ref')}': {e}[/yellow]")
+
+        batch_created, batch_errors = _insert_in_batches(
+            invoice_crud, parsed_rows(), progress, task, "invoice", "reference", verbose
+        )
+        created += batch_created
+        errors += batch_errors
 
     if errors > 0:
         console.print(f"Loaded {created} invoices from {path} ({errors} errors)", style="yellow")
@@ -280,6 +235,204 @@ def load_invoices(
         console.print(f"Loaded {created} invoices from {path}", style="green")
 
 
+@fixtures_app.command("bootstrap")
+def bootstrap(
+    fixtures_dir: Annotated[Path, typer.Argument(help="Directory containing the fixtures files")] = None,
+    db_path: Annotated[Path, typer.Option("--db", help="Path to database file")] = None,
+    verbose: bool = False,
+):
+    """Load customers, products and invoices fixtures into a fresh database.
+
+    Disk syncs are turned off for the whole import: if it is interrupted,
+    delete the database file and run the command again.
+    """
+    from sqlalchemy import event
+
+    from sam_invoice.models.crud_customer import customer_crud
+    from sam_invoice.models.crud_invoice import invoice_crud
+    from sam_invoice.models.crud_product import product_crud
+
+    # Set database path if provided
+    if db_path:
+        db_manager.set_database_path(db_path)
+
+    if fixtures_dir is None:
+        fixtures_dir = _FIXTURES_DIR
+
+    # Ensure DB exists and is empty
+    db_manager.init_db()
+    if customer_crud.count() or product_crud.count() or invoice_crud.count():
+        typer.echo("Database is not empty, use the load-* commands instead.")
+        raise typer.Exit(code=1)
+
+    engine = db_manager.engine
+    event.listen(engine, "checkout", _disable_sync)
+    try:
+        load_customers(fixtures_dir / "customers.json", verbose=verbose)
+        load_products(fixtures_dir / "products.json", verbose=verbose)
+        load_invoices(fixtures_dir / "invoices.json", verbose=verbose)
+    finally:
+        event.remove(engine, "checkout", _disable_sync)
+        # Drop the pooled connections so new ones get the default pragmas back
+        engine.dispose()
+
+
+@invoices_app.command("export-pdf")
+def export_pdf(
+    out_dir: Annotated[Path, typer.Argument(help="Directory receiving one PDF per invoice")],
+    db_path: Annotated[Path, typer.Option("--db", help="Path to database file")] = None,
+    workers: Annotated[int, typer.Option("--workers", help="Worker processes (default: CPU count)")] = None,
+):
+    """Export every invoice as a PDF, rendered in parallel worker processes."""
+    from sam_invoice.models.crud_invoice import invoice_crud
+    from sam_invoice.tools.pdf_batch import render_batch
+
+    if db_path:
+        db_manager.set_database_path(db_path)
+
+    invoice_ids = [row.id for row in invoice_crud.get_all_rows()]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = render_batch(invoice_ids, out_dir, max_workers=workers)
+    typer.echo(f"Exported {len(paths)} invoices to {out_dir}")
+
+
+def _disable_sync(dbapi_connection, _connection_record, _connection_proxy) -> None:
+    """Stop SQLite from syncing to disk on a checked out connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.close()
+
+
+def _read_fixtures(path: Path) -> list[dict]:
+    """Read the records of a fixtures file.
+
+    Args:
+        path: Path to a JSON file containing a top-level array
+
+    Returns:
+        List of records
+    """
+    return json.loads(path.read_bytes())
+
+
+def _invoice_row(item: dict, today: date) -> dict:
+    """Convert an invoice fixture record to `create()` keyword arguments.
+
+    Args:
+        item: Invoice record from the fixtures file
+        today: Date used when the record has none
+
+    Returns:
+        Column values of the invoice, including `items_data`
+    """
+    date_str = item.get("date")
+    due_date_str = item.get("echeance")
+    customer_raw = item.get("client", "")
+
+    # Parse customer name and address
+    customer_lines = _NEWLINE_RE.split(customer_raw.strip())
+    customer_name = customer_lines[0]
+    customer_address = "\n".join(customer_lines[1:])
+
+    # Parse items
+    items_data = [
+        {
+            "product_name": achat.get("desc", ""),
+            "quantity": int(achat.get("quantite", 1)),
+            "unit_price": float(achat.get("puht", 0)),
+            "total_price": float(achat.get("pht", 0)),
+        }
+        for achat in item.get("achats", [])
+    ]
+
+    return {
+        "reference": item.get("ref"),
+        "date": date.fromisoformat(date_str) if date_str else today,
+        "due_date": date.fromisoformat(due_date_str) if due_date_str else None,
+        "customer_name": customer_name,
+        "customer_address": customer_address,
+        "subtotal": float(item.get("sumHT", 0)),
+        "tax": float(item.get("sumTVA", 0)),
+        "total": float(item.get("sumTTC", 0)),
+        "items_data": items_data,
+    }
+
+
+def _prefetch_batches(rows: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    """Yield batches of rows prepared by a background thread.
+
+    Parsing and building the next batches overlaps with inserting the
+    current one, as SQLite releases the GIL while it executes.
+
+    Args:
+        rows: Column values of each row, consumed by the background thread
+        size: Number of rows per batch
+
+    Yields:
+        Lists of at most `size` rows
+    """
+    batches = queue.Queue(maxsize=_PREFETCH_BATCHES)
+
+    def produce():
+        try:
+            for chunk in batched(rows, size):
+                batches.put(list(chunk))
+        except Exception as e:
+            batches.put(e)
+        else:
+            batches.put(None)
+
+    threading.Thread(target=produce, daemon=True).start()
+    while (batch := batches.get()) is not None:
+        if isinstance(batch, Exception):
+            raise batch
+        yield batch
+
+
+def _insert_in_batches(crud, rows, progress, task, label, key, verbose):
+    """Insert rows in batches through one shared session.
+
+    Each batch is committed on its own. A batch that fails is rolled back
+    and retried row by row so the offending rows can be reported while the
+    others are still imported.
+
+    Args:
+        crud: CRUD instance providing `create_many`.
+        rows: Column values of each row to insert, consumed lazily.
+        progress: Progress bar to advance.
+        task: Progress task id.
+        label: Singular name of the imported entity, used in messages.
+        key: Field identifying a row in warning messages.
+        verbose: Print a line for each inserted batch.
+
+    Returns:
+        Tuple of (created, errors) counts.
+    """
+    created = 0
+    errors = 0
+    with db_manager.get_session() as session:
+        for batch in _prefetch_batches(rows, _BATCH_SIZE):
+            try:
+                created += crud.create_many(batch, session=session)
+                session.commit()
+                if verbose:
+                    console.print(f"Created {len(batch)} {label}s")
+            except Exception:
+                session.rollback()
+                # Fall back to one row at a time to isolate the failing rows
+                for row in batch:
+                    try:
+                        created += crud.create_many([row], session=session)
+                        session.commit()
+                    except Exception as e:
+                        session.rollback()
+                        errors += 1
+                        console.print(f"[yellow]Warning: Failed to create {label} '{row.get(key)}': {e}[/yellow]")
+            finally:
+                progress.advance(task, len(batch))
+    return created, errors
+
+
 def main():
     app()
 
@@ -0,0 +1,6 @@
+"""Declarative base shared by all SQLAlchemy models."""
+
+from sqlalchemy.orm import declarative_base
+
+# Declarative base for all SQLAlchemy models
+Base = declarative_base()
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import TypeVar
 
-from sqlalchemy import or_
+from sqlalchemy import Row, func, insert, or_
 
 from . import database
 
@@ -34,6 +34,26 @@ class BaseCRUD[T](ABC):
         with database.db_manager.get_session() as session:
             return session.query(self.model).order_by(self._get_sort_field()).all()
 
+    def get_all_rows(self) -> list[Row]:
+        """Retrieve all entities as plain column rows, sorted by the default field.
+
+        Suits read-only lists, like `search_rows()`.
+
+        Returns:
+            List of rows, one per entity
+        """
+        with database.db_manager.get_session() as session:
+            return session.query(*self.model.__table__.columns).order_by(self._get_sort_field()).all()
+
+    def count(self) -> int:
+        """Count all entities.
+
+        Returns:
+            Number of entities
+        """
+        with database.db_manager.get_session() as session:
+            return session.query(func.count(self.model.id)).scalar()
+
     def get_by_id(self, entity_id: int) -> T | None:
         """Retrieve an entity by its ID.
 
@@ -44,7 +64,27 @@ class BaseCRUD[T](ABC):
             The entity if found, None otherwise
         """
         with database.db_manager.get_session() as session:
-            return session.query(self.model).filter(self.model.id == entity_id).first()
+            return session.get(self.model, entity_id, options=self._get_load_options())
+
+    def create_many(self, rows: list[dict], session=None) -> int:
+        """Create several entities in a single transaction.
+
+        Args:
+            rows: Column values of each entity to create
+            session: Session to insert into, committed by the caller (a new
+                session is opened and committed if omitted)
+
+        Returns:
+            Number of entities created
+        """
+        # Core insert: one executemany, no ORM objects or identity map
+        if session is not None:
+            session.execute(insert(self.model), rows)
+            return len(rows)
+        with database.db_manager.get_session() as session:
+            session.execute(insert(self.model), rows)
+            session.commit()
+        return len(rows)
 
     def delete(self, entity_id: int) -> T | None:
         """Delete an entity from the database.
@@ -56,7 +96,7 @@ class BaseCRUD[T](ABC):
             The deleted entity if found, None otherwise
         """
         with database.db_manager.get_session() as session:
-            entity = session.query(self.model).filter(self.model.id == entity_id).first()
+            entity = session.get(self.model, entity_id, options=self._get_load_options())
             session.delete(entity)
             session.commit()
             return entity
@@ -72,13 +112,39 @@ class BaseCRUD[T](ABC):
             List of matching entities
         """
         with database.db_manager.get_session() as session:
-            q = (query or "").strip()
+            return self._search_query(session.query(self.model), query, limit).all()
+
+    def search_rows(self, query: str, limit: int | None = None) -> list[Row]:
+        """Search like `search()`, returning plain column rows instead of entities.
+
+        Rows expose each column as an attribute but skip ORM instance
+        construction and identity tracking, which suits read-only lists.
+
+        Args:
+            query: Search text
+            limit: Maximum number of results (None = no limit)
+
+        Returns:
+            List of matching rows
+        """
+        with database.db_manager.get_session() as session:
+            return self._search_query(session.query(*self.model.__table__.columns), query, limit).all()
+
+    def _search_query(self, stmt, query: str, limit: int | None):
+        """Apply search filters, sort order and limit to a query.
 
-            # If no search query, return all
-            if not q:
-                stmt = session.query(self.model).order_by(self._get_sort_field())
-                return stmt.limit(limit).all() if limit else stmt.all()
+        Args:
+            stmt: Query to refine
+            query: Search text (empty = no filter)
+            limit: Maximum number of results (None = no limit)
+
+        Returns:
+            The refined query
+        """
+        q = (query or "").strip()
 
+        # Filter only when there is a search query (otherwise return all)
+        if q:
             # Build search filters
             filters = self._get_search_filters(q)
 
@@ -88,9 +154,10 @@ class BaseCRUD[T](ABC):
             except ValueError:
                 pass
 
-            # Execute search
-            stmt = session.query(self.model).filter(or_(*filters)).order_by(self._get_sort_field())
-            return stmt.limit(limit).all() if limit else stmt.all()
+            stmt = stmt.filter(or_(*filters))
+
+        stmt = stmt.order_by(self._get_sort_field())
+        return stmt.limit(limit) if limit else stmt
 
     @abstractmethod
     def create(self, **kwargs) -> T:
@@ -137,3 +204,11 @@ class BaseCRUD[T](ABC):
             SQLAlchemy column expression for sorting
         """
         pass
+
+    def _get_load_options(self) -> list:
+        """Get the loader options applied when fetching a single entity.
+
+        Returns:
+            List of SQLAlchemy loader options (none by default)
+        """
+        return []
@@ -2,7 +2,7 @@
 
 from sqlalchemy import Column, Integer, LargeBinary, String
 
-from .customer import Base
+from .base import Base
 
 
 class Company(Base):
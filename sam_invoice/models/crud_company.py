@@ -40,7 +40,6 @@ def create_or_update_company(name: str, address: str = None, email: str = None,
             session.add(company)
 
         session.commit()
-        session.refresh(company)
         return company
 
 
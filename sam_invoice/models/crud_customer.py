@@ -28,7 +28,6 @@ class CustomerCRUD(BaseCRUD[Customer]):
             customer = Customer(name=name, address=address, email=email)
             session.add(customer)
             session.commit()
-            session.refresh(customer)
             return customer
 
     def update(self, customer_id: int, name: str = None, address: str = None, email: str = None) -> Customer | None:
@@ -44,7 +43,7 @@ class CustomerCRUD(BaseCRUD[Customer]):
             The updated customer if found, None otherwise
         """
         with database.db_manager.get_session() as session:
-            customer = session.query(Customer).filter(Customer.id == customer_id).first()
+            customer = session.get(Customer, customer_id)
             if customer:
                 if name is not None:
                     customer.name = name
@@ -53,7 +52,6 @@ class CustomerCRUD(BaseCRUD[Customer]):
                 if email is not None:
                     customer.email = email
                 session.commit()
-                session.refresh(customer)
             return customer
 
     def _get_search_filters(self, query: str) -> list:
@@ -61,10 +59,11 @@ class CustomerCRUD(BaseCRUD[Customer]):
 
         Searches in: name, email, address
         """
+        pattern = f"%{query}%"
         return [
-            Customer.name.ilike(f"%{query}%"),
-            Customer.email.ilike(f"%{query}%"),
-            Customer.address.ilike(f"%{query}%"),
+            Customer.name.ilike(pattern),
+            Customer.email.ilike(pattern),
+            Customer.address.ilike(pattern),
         ]
 
     def _get_sort_field(self):
@@ -1,11 +1,19 @@
 """CRUD operations for invoices."""
 
-from sqlalchemy import desc
+from itertools import groupby
+from operator import attrgetter
+
+from sqlalchemy import delete, desc, insert, inspect, select, update
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from . import database
 from .base_crud import BaseCRUD
 from .invoice import Invoice, InvoiceItem
 
+# Invoice columns that update() may set from its keyword arguments
+_UPDATABLE_FIELDS = frozenset(attr.key for attr in inspect(Invoice).column_attrs)
+
 
 class InvoiceCRUD(BaseCRUD[Invoice]):
     """CRUD operations for Invoice entities."""
@@ -53,77 +61,154 @@ class InvoiceCRUD(BaseCRUD[Invoice]):
                 tax=tax,
                 total=total,
             )
+            session.add(invoice)
+            session.flush()
 
-            for item_data in items_data:
-                item = InvoiceItem(
-                    product_name=item_data["product_name"],
-                    quantity=item_data["quantity"],
-                    unit_price=item_data["unit_price"],
-                    total_price=item_data["total_price"],
-                    product_id=item_data.get("product_id"),  # Optional product reference
-                )
-                invoice.items.append(item)
+            # One multi-row INSERT for all items; RETURNING gives back the
+            # instances, in no particular order, so sort them like a reload
+            items = []
+            if items_data:
+                stmt = insert(InvoiceItem).returning(InvoiceItem)
+                items = sorted(session.scalars(stmt, _item_rows(invoice.id, items_data)), key=attrgetter("id"))
+            set_committed_value(invoice, "items", items)
 
-            session.add(invoice)
             session.commit()
-            session.refresh(invoice)
             return invoice
 
+    def create_many(self, rows: list[dict], session=None) -> int:
+        """Create several invoices with their items in a single transaction.
+
+        Args:
+            rows: Keyword arguments of `create()` for each invoice, including `items_data`
+            session: Session to insert into, committed by the caller (a new
+                session is opened and committed if omitted)
+
+        Returns:
+            Number of invoices created
+        """
+        if session is not None:
+            self._add_invoices(session, rows)
+            return len(rows)
+        with database.db_manager.get_session() as session:
+            self._add_invoices(session, rows)
+            session.commit()
+        return len(rows)
+
+    def _add_invoices(self, session, rows: list[dict]) -> None:
+        """Insert invoices and their items into a session without committing."""
+        invoice_rows = [{key: value for key, value in row.items() if key != "items_data"} for row in rows]
+        # Multi-row INSERT; the unique references link the returned ids to the items
+        stmt = insert(Invoice).returning(Invoice.reference, Invoice.id)
+        invoice_ids = {reference: invoice_id for reference, invoice_id in session.execute(stmt, invoice_rows)}
+
+        item_rows = [
+            item_row for row in rows for item_row in _item_rows(invoice_ids[row["reference"]], row["items_data"])
+        ]
+        if item_rows:
+            session.execute(insert(InvoiceItem), item_rows)
+
     def update(self, invoice_id: int, items_data: list[dict] = None, **kwargs) -> Invoice | None:
         """Update an existing invoice.
 
         Args:
             invoice_id: The invoice's ID
-            items_data: Optional list of new items (replaces existing ones)
+            items_data: Optional list of new items (replaces existing ones, matched by `id`)
             **kwargs: Fields to update (reference, date, customer_name, etc.)
 
         Returns:
             The updated invoice if found, None otherwise
         """
         with database.db_manager.get_session() as session:
-            invoice = session.query(Invoice).filter(Invoice.id == invoice_id).first()
+            invoice = session.get(Invoice, invoice_id, options=self._get_load_options())
             if invoice:
                 # TODO: uniformize the approach
                 # Update fields
                 for key, value in kwargs.items():
-                    if hasattr(invoice, key):
+                    if key in _UPDATABLE_FIELDS:
                         setattr(invoice, key, value)
 
                 # Update items if provided
                 if items_data is not None:
-                    # Remove existing items
-                    session.query(InvoiceItem).filter(InvoiceItem.invoice_id == invoice.id).delete()
-
-                    # Add new items
-                    for item_data in items_data:
-                        item = InvoiceItem(
-                            invoice_id=invoice.id,
-                            product_name=item_data["product_name"],
-                            quantity=item_data["quantity"],
-                            unit_price=item_data["unit_price"],
-                            total_price=item_data["total_price"],
-                            product_id=item_data.get("product_id"),
-                        )
-                        session.add(item)
+                    self._merge_items(session, invoice, items_data)
 
                 session.commit()
-                session.refresh(invoice)
             return invoice
 
+    def _merge_items(self, session, invoice: Invoice, items_data: list[dict]) -> None:
+        """Write only the item changes between an invoice and the new items.
+
+        Items whose `id` belongs to the invoice are updated when a value
+        changed, items without a known `id` are inserted and the remaining
+        existing items are deleted. The invoice's `items` collection is
+        updated in place, so it needs no reload afterwards.
+
+        Args:
+            session: Session of the invoice, committed by the caller
+            invoice: The invoice being updated, with its current items
+            items_data: List of dicts with item details, `id` set for existing items
+        """
+        existing = {item.id: item for item in invoice.items}
+        kept = []
+        updates = []
+        inserts = []
+        for item_data, row in zip(items_data, _item_rows(invoice.id, items_data), strict=True):
+            item = existing.get(item_data.get("id"))
+            if item is None:
+                inserts.append(row)
+                continue
+            kept.append(item)
+            if any(getattr(item, key) != value for key, value in row.items()):
+                updates.append({"id": item.id, **row})
+
+        kept_ids = {item.id for item in kept}
+        delete_ids = [item_id for item_id in existing if item_id not in kept_ids]
+
+        if delete_ids:
+            session.execute(delete(InvoiceItem).where(InvoiceItem.id.in_(delete_ids)))
+        if updates:
+            session.execute(update(InvoiceItem), updates)
+            # Bulk updates bypass the loaded items, apply the values to them too
+            for values in updates:
+                item = existing[values["id"]]
+                for key, value in values.items():
+                    set_committed_value(item, key, value)
+        new_items = []
+        if inserts:
+            new_items = list(session.scalars(insert(InvoiceItem).returning(InvoiceItem), inserts))
+
+        set_committed_value(invoice, "items", sorted(kept + new_items, key=attrgetter("id")))
+
     def _get_search_filters(self, query: str) -> list:
         """Get search filters for invoices.
 
         Searches in: reference, customer_name
         """
+        pattern = f"%{query}%"
         return [
-            Invoice.reference.ilike(f"%{query}%"),
-            Invoice.customer_name.ilike(f"%{query}%"),
+            Invoice.reference.ilike(pattern),
+            Invoice.customer_name.ilike(pattern),
         ]
 
     def _get_sort_field(self):
         """Sort invoices by date descending."""
         return desc(Invoice.date)
 
+    def _get_load_options(self) -> list:
+        """Load the items with a single invoice."""
+        return [selectinload(Invoice.items)]
+
+    def get_references(self, prefix: str) -> list[str]:
+        """Get the references starting with a prefix, without loading the invoices.
+
+        Args:
+            prefix: Start of the references, e.g. "INV-2024-"
+
+        Returns:
+            Matching references
+        """
+        with database.db_manager.get_session() as session:
+            return list(session.scalars(select(Invoice.reference).where(Invoice.reference.startswith(prefix))))
+
     def get_for_customer(self, customer_id: int) -> list[Invoice]:
         """Get invoices for a specific customer by ID.
 
@@ -138,10 +223,63 @@ class InvoiceCRUD(BaseCRUD[Invoice]):
 
         with database.db_manager.get_session() as session:
             invoices = (
-                session.query(Invoice).filter(Invoice.customer_id == customer_id).order_by(desc(Invoice.date)).all()
+                session.query(Invoice)
+                .options(selectinload(Invoice.items))
+                .filter(Invoice.customer_id == customer_id)
+                .order_by(desc(Invoice.date))
+                .all()
             )
             return invoices
 
+    def get_for_customers(self, customer_ids: list[int]) -> dict[int, list[Invoice]]:
+        """Get the invoices of several customers with a single query.
+
+        Args:
+            customer_ids: IDs of the customers
+
+        Returns:
+            Invoices of each requested customer, sorted by date (newest first);
+            customers without invoices map to an empty list
+        """
+        invoices_by_customer = {customer_id: [] for customer_id in customer_ids if customer_id}
+        if not invoices_by_customer:
+            return invoices_by_customer
+
+        with database.db_manager.get_session() as session:
+            invoices = (
+                session.query(Invoice)
+                .options(selectinload(Invoice.items))
+                .filter(Invoice.customer_id.in_(invoices_by_customer))
+                .order_by(Invoice.customer_id, desc(Invoice.date))
+                .all()
+            )
+        for customer_id, customer_invoices in groupby(invoices, key=attrgetter("customer_id")):
+            invoices_by_customer[customer_id] = list(customer_invoices)
+        return invoices_by_customer
+
+
+def _item_rows(invoice_id: int, items_data: list[dict]) -> list[dict]:
+    """Build invoice item column values for a bulk insert.
+
+    Args:
+        invoice_id: ID of the invoice owning the items
+        items_data: List of dicts with item details (product_name, quantity, unit_price, total_price)
+
+    Returns:
+        Column values of each item, all with the same keys
+    """
+    return [
+        {
+            "invoice_id": invoice_id,
+            "product_name": item_data["product_name"],
+            "quantity": item_data["quantity"],
+            "unit_price": item_data["unit_price"],
+            "total_price": item_data["total_price"],
+            "product_id": item_data.get("product_id"),  # Optional product reference
+        }
+        for item_data in items_data
+    ]
+
 
 # Create singleton instance
 invoice_crud = InvoiceCRUD()
@@ -37,7 +37,6 @@ class ProductCRUD(BaseCRUD[Product]):
             product = Product(reference=reference, name=name, price=price, stock=stock, sold=sold)
             session.add(product)
             session.commit()
-            session.refresh(product)
             return product
 
     def update(
@@ -72,7 +71,6 @@ class ProductCRUD(BaseCRUD[Product]):
                 if sold is not None:
                     product.sold = sold
                 session.commit()
-                session.refresh(product)
             return product
 
     def _get_search_filters(self, query: str) -> list:
@@ -80,9 +78,10 @@ class ProductCRUD(BaseCRUD[Product]):
 
         Searches in: reference, name
         """
+        pattern = f"%{query}%"
         return [
-            Product.reference.ilike(f"%{query}%"),
-            Product.name.ilike(f"%{query}%"),
+            Product.reference.ilike(pattern),
+            Product.name.ilike(pattern),
         ]
 
     def _get_sort_field(self):
@@ -1,10 +1,8 @@
 """Data model for customers."""
 
-from sqlalchemy import CheckConstraint, Column, Integer, String
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import CheckConstraint, Column, Index, Integer, String, func
 
-# Declarative base for all SQLAlchemy models
-Base = declarative_base()
+from .base import Base
 
 
 class Customer(Base):
@@ -25,3 +23,7 @@ class Customer(Base):
     name = Column(String, nullable=False)
     address = Column(String, nullable=False)
     email = Column(String)
+
+
+# Serves the case-insensitive sort used by lists and searches
+Index("ix_customers_name_lower", func.lower(Customer.name))
@@ -3,17 +3,52 @@
 import logging
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex
 
 # Import all models to register them with Base metadata
 from . import company, customer, invoice, product  # noqa: F401
-from .customer import Base
+from .base import Base
 
 # Reduce SQLAlchemy logs to WARNING level
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
 
+# Applied to every new SQLite connection (WAL itself persists in the file)
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Tune a freshly opened SQLite connection.
+
+    WAL with `synchronous=NORMAL` only syncs at checkpoints instead of on
+    every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def default_db_path() -> Path:
+    """Return the database used when no path is given.
+
+    Resolved on each call, so it follows the current working directory
+    rather than the one the package was imported from.
+
+    Returns:
+        Path of `invoices.db` in the current working directory
+    """
+    return Path.cwd() / "invoices.db"
+
+
 class DatabaseManager:
     """Manages SQLite database connections and session factory.
 
@@ -22,38 +57,65 @@ class DatabaseManager:
     """
 
     def __init__(self, db_path: Path | str | None = None):
+        self.db_path = None
         self.engine = None
         self.SessionLocal = None
-        if db_path is None:
-            db_path = Path.cwd() / "invoices.db"
-        self.set_database_path(db_path)
+        # Without a path, the default database is opened on first use
+        if db_path is not None:
+            self.set_database_path(db_path)
 
-    def set_database_path(self, db_path: Path | str) -> None:
+    def set_database_path(self, db_path: Path | str, create: bool = True) -> None:
         """Set the database path and reinitialize the engine.
 
         Args:
             db_path: Path to the SQLite database file
+            create: Create the file if it does not exist. When False, the file
+                is opened right away and `sqlalchemy.exc.OperationalError` is
+                raised if it is missing, leaving the current database in place
+
+        Raises:
+            OperationalError: If `create` is False and the file cannot be opened
         """
         if isinstance(db_path, str):
             db_path = Path(db_path)
 
-        database_url = f"sqlite:///{db_path.absolute()}"
-        self.engine = create_engine(database_url, echo=False)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        db_path = db_path.absolute()
+        if create:
+            database_url = f"sqlite:///{db_path}"
+        else:
+            # SQLite's URI mode=rw opens an existing file but never creates one
+            database_url = f"sqlite:///{db_path.as_uri()}?mode=rw&uri=true"
+        engine = create_engine(database_url, echo=False)
+        event.listen(engine, "connect", _set_sqlite_pragmas)
+        if not create:
+            # The pool keeps this connection for the first query
+            engine.connect().close()
+
+        self.db_path = db_path
+        self.engine = engine
+        # Keep loaded attributes after commit so returned objects need no reload
+        self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
 
     def init_db(self) -> None:
-        """Initialize the database by creating all tables."""
-        if self.engine is None:
-            # Réinitialise sur le chemin par défaut si jamais non initialisé
-            self.set_database_path(Path.cwd() / "invoices.db")
+        """Initialize the database by creating all missing tables and indexes."""
+        self._ensure_database()
         Base.metadata.create_all(bind=self.engine)
+        # create_all() skips the indexes of tables that already exist
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    conn.execute(CreateIndex(index, if_not_exists=True))
 
     def get_session(self):
         """Get a new database session."""
-        if self.SessionLocal is None:
-            raise RuntimeError("Database not initialized. Call init_db() first.")
+        self._ensure_database()
         return self.SessionLocal()
 
+    def _ensure_database(self) -> None:
+        """Open the default database if no path has been set yet."""
+        if self.engine is None:
+            self.set_database_path(default_db_path())
+
 
 # Singleton instance exposée
 db_manager = DatabaseManager()
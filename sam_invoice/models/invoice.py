@@ -1,9 +1,9 @@
 """Data model for invoices."""
 
-from sqlalchemy import Column, Date, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, Date, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
-from .customer import Base
+from .base import Base
 
 
 class Invoice(Base):
@@ -33,8 +33,9 @@ class Invoice(Base):
 
     # Relationships
     customer = relationship("Customer", foreign_keys=[customer_id])
-    # TODO: explain
-    items = relationship("InvoiceItem", back_populates="invoice", cascade="all, delete-orphan", lazy="selectin")
+    # Never loaded implicitly: lists of invoices skip the items, queries that
+    # need them opt in with selectinload(Invoice.items)
+    items = relationship("InvoiceItem", back_populates="invoice", cascade="all, delete-orphan", lazy="raise")
 
 
 class InvoiceItem(Base):
@@ -54,3 +55,10 @@ class InvoiceItem(Base):
     # Relationships
     invoice = relationship("Invoice", back_populates="items")
     product = relationship("Product", foreign_keys=[product_id])  # Link to product catalog
+
+
+# Serve the invoice list and a customer's history, newest first, without a sort
+Index("ix_invoices_date", Invoice.date)
+Index("ix_invoices_customer_date", Invoice.customer_id, Invoice.date.desc())
+# Serves loading and replacing the items of an invoice
+Index("ix_invoice_items_invoice_id", InvoiceItem.invoice_id)
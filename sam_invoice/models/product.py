@@ -1,8 +1,8 @@
 """Data model for products."""
 
-from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy import Column, Float, Index, Integer, String, func
 
-from .customer import Base
+from .base import Base
 
 
 class Product(Base):
@@ -16,3 +16,7 @@ class Product(Base):
     price = Column(Float)  # Unit price
     stock = Column(Integer)  # Quantity in stock
     sold = Column(Integer)  # Quantity sold
+
+
+# Serves the case-insensitive sort used by lists and searches
+Index("ix_products_reference_lower", func.lower(Product.reference))
@@ -1,11 +1,25 @@
 """Application style and theme management."""
 
+import argparse
+import functools
 import platform
 import sys
 from pathlib import Path
 
-from PySide6.QtGui import QColor, QPalette
-from PySide6.QtWidgets import QApplication, QStyleFactory
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+
+# Base path for bundled app (PyInstaller) vs development, resolved once
+if getattr(sys, "frozen", False):
+    _BASE_PATH = Path(sys._MEIPASS)
+else:
+    _BASE_PATH = Path(__file__).resolve().parent
+
+# Candidate stylesheet locations, bundled layout first
+_STYLESHEET_PATHS = (
+    _BASE_PATH / "sam_invoice" / "assets" / "styles" / "macos.qss",
+    _BASE_PATH / "assets" / "styles" / "macos.qss",
+)
 
 
 def setup_application_style(app: QApplication) -> None:
@@ -14,54 +28,74 @@ def setup_application_style(app: QApplication) -> None:
     Args:
         app: The QApplication instance to configure
     """
-    # Discover available styles
-    available = list(QStyleFactory.keys())
-
     # Respect requested style from command line (-style macOS)
     requested_style = _get_requested_style()
 
-    # Apply style
+    # Apply style (a valid -style has already been applied by QApplication itself)
     if requested_style:
-        if requested_style in available:
-            app.setStyle(requested_style)
-        else:
+        available = _available_styles()
+        if requested_style not in available and available:
             fallback = "macOS" if "macOS" in available else "Fusion"
-            if available:
-                app.setStyle(fallback)
-    else:
-        # Default to macOS if available
-        if "macOS" in available:
-            app.setStyle("macOS")
-
-    # Determine style class
-    style_class = app.style().__class__.__name__ if app.style() else None
-
-    # Apply macOS palette if using QCommonStyle
+            app.setStyle(fallback)
+    elif sys.platform == "darwin":
+        # Default to macOS; the style plugin only exists on macOS, so other
+        # platforms skip the lookup entirely
+        app.setStyle("macOS")
+
+    # Determine style class. PySide does not wrap QMacStyle, so the native
+    # macOS style also reports QCommonStyle: tell it apart by its name.
+    style = app.style()
+    style_class = style.__class__.__name__ if style else None
+    if style_class == "QCommonStyle" and style.name().lower() == "macos":
+        style_class = "QMacStyle"
+
+    # Apply macOS palette if using QCommonStyle (the native style has its own)
     if requested_style and requested_style.lower().startswith("mac") and style_class == "QCommonStyle":
         _apply_macos_palette(app)
 
-    # Load and apply stylesheet
-    _load_stylesheet(app, requested_style, style_class)
+    # Load and apply stylesheet once the event loop runs, so reading and parsing
+    # it does not delay building and showing the main window
+    QTimer.singleShot(0, functools.partial(_load_stylesheet, app, requested_style, style_class))
+
+
+@functools.cache
+def _available_styles() -> tuple[str, ...]:
+    """Return the style names known to Qt (plugin scan done once)."""
+    from PySide6.QtWidgets import QStyleFactory
+
+    return tuple(QStyleFactory.keys())
 
 
 def _get_requested_style() -> str | None:
     """Extract requested style from command line arguments."""
-    for i, arg in enumerate(sys.argv):
-        if arg == "-style" and i + 1 < len(sys.argv):
-            return sys.argv[i + 1]
-    return None
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("-style", nargs="?")
+    args, _ = parser.parse_known_args(sys.argv[1:])
+    return args.style
 
 
 def _apply_macos_palette(app: QApplication) -> None:
     """Apply macOS-like color palette to the application."""
+    app.setPalette(_macos_palette())
+
+
+@functools.cache
+def _macos_palette():
+    """Build the macOS-like palette (built once per process)."""
+    from PySide6.QtGui import QColor, QPalette
+
+    light_gray = QColor("#ececec")
+    white = QColor("#ffffff")
+    black = QColor("#000000")
+
     mac_pal = QPalette()
-    mac_pal.setColor(QPalette.ColorRole.Window, QColor("#ececec"))
-    mac_pal.setColor(QPalette.ColorRole.Button, QColor("#ececec"))
-    mac_pal.setColor(QPalette.ColorRole.Base, QColor("#ffffff"))
-    mac_pal.setColor(QPalette.ColorRole.Text, QColor("#000000"))
-    mac_pal.setColor(QPalette.ColorRole.ButtonText, QColor("#000000"))
+    mac_pal.setColor(QPalette.ColorRole.Window, light_gray)
+    mac_pal.setColor(QPalette.ColorRole.Button, light_gray)
+    mac_pal.setColor(QPalette.ColorRole.Base, white)
+    mac_pal.setColor(QPalette.ColorRole.Text, black)
+    mac_pal.setColor(QPalette.ColorRole.ButtonText, black)
     mac_pal.setColor(QPalette.ColorRole.Highlight, QColor("#a5cdff"))
-    app.setPalette(mac_pal)
+    return mac_pal
 
 
 def _load_stylesheet(app: QApplication, requested_style: str | None, style_class: str | None) -> None:
@@ -72,47 +106,38 @@ def _load_stylesheet(app: QApplication, requested_style: str | None, style_class
         requested_style: Style requested via command line
         style_class: Current style class name
     """
+    # Apply macOS style if on macOS platform or if explicitly requested
+    should_apply = (
+        platform.system() == "Darwin"  # Always on macOS
+        or (requested_style and requested_style.lower().startswith("mac"))
+        or style_class == "QCommonStyle"
+    )
+    if not should_apply:
+        return
+
     try:
-        qss_path = _find_stylesheet_path()
-
-        # Apply macOS style if on macOS platform or if explicitly requested
-        should_apply = (
-            platform.system() == "Darwin"  # Always on macOS
-            or (requested_style and requested_style.lower().startswith("mac"))
-            or style_class == "QCommonStyle"
-        )
-
-        if qss_path and qss_path.exists() and should_apply:
-            with qss_path.open("r", encoding="utf-8") as f:
-                qss = f.read()
-            if qss:
-                app.setStyleSheet(qss)
+        qss = _read_stylesheet()
+        if qss:
+            app.setStyleSheet(qss)
     except Exception as e:
         print(f"Warning: Could not load stylesheet: {e}")
 
 
-def _find_stylesheet_path() -> Path | None:
-    """Find the path to the macos.qss stylesheet.
+@functools.cache
+def _read_stylesheet() -> str | None:
+    """Read the macos.qss stylesheet (read once per process).
+
+    Candidate locations are opened directly rather than probed with
+    `exists()` first, so the common case costs a single open.
 
     Returns:
-        Path to stylesheet if found, None otherwise
+        Stylesheet content if found, None otherwise
     """
-    # Determine base path for bundled app vs development
-    if getattr(sys, "frozen", False):
-        # Running in a PyInstaller bundle
-        base_path = Path(sys._MEIPASS)
-    else:
-        # Running in normal Python environment
-        base_path = Path(__file__).parent
-
-    # Try bundled path first
-    qss_path = base_path / "sam_invoice" / "assets" / "styles" / "macos.qss"
-    if qss_path.exists():
-        return qss_path
-
-    # Try development path
-    qss_path = base_path / "assets" / "styles" / "macos.qss"
-    if qss_path.exists():
-        return qss_path
+    # Try bundled path first, then development path
+    for qss_path in _STYLESHEET_PATHS:
+        try:
+            return qss_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            continue
 
     return None
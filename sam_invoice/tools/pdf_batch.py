@@ -0,0 +1,56 @@
+"""Parallel PDF export of invoice batches."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from sam_invoice.models import database
+from sam_invoice.models.crud_invoice import invoice_crud
+from sam_invoice.tools.pdf_generator import InvoicePDFGenerator
+
+
+def render_batch(invoice_ids: list[int], out_dir: Path, max_workers: int | None = None) -> list[Path]:
+    """Render one PDF per invoice in parallel worker processes.
+
+    Each worker opens the current database itself and loads the invoices it
+    renders, so only ids and paths cross the process boundary.
+
+    Args:
+        invoice_ids: IDs of the invoices to render
+        out_dir: Directory receiving one `<reference>.pdf` file per invoice
+        max_workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Paths of the generated PDFs, in the order of `invoice_ids`
+    """
+    if not invoice_ids:
+        return []
+
+    db_path = database.db_manager.db_path or database.default_db_path()
+    workers = min(len(invoice_ids), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(db_path,)) as executor:
+        # Results come back in order; consuming them re-raises the first error
+        return list(executor.map(_render_one, invoice_ids, [Path(out_dir)] * len(invoice_ids)))
+
+
+def _init_worker(db_path: Path) -> None:
+    """Point a worker process at the database of the parent process."""
+    database.db_manager.set_database_path(db_path)
+
+
+def _render_one(invoice_id: int, out_dir: Path) -> Path:
+    """Render a single invoice PDF (runs in a worker process).
+
+    Args:
+        invoice_id: ID of the invoice to render
+        out_dir: Directory receiving the PDF
+
+    Returns:
+        Path of the generated PDF
+    """
+    invoice = invoice_crud.get_by_id(invoice_id)
+    if invoice is None:
+        raise ValueError(f"Invoice {invoice_id} not found")
+    out_path = out_dir / f"{invoice.reference}.pdf"
+    InvoicePDFGenerator(out_path).generate(invoice)
+    return out_path
@@ -1,5 +1,6 @@
 """PDF Generator for Invoices using ReportLab."""
 
+import functools
 from pathlib import Path
 
 from reportlab.lib import colors
@@ -8,6 +9,8 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import cm
 from reportlab.platypus import (
+    LongTable,
+    PageBreak,
     Paragraph,
     SimpleDocTemplate,
     Spacer,
@@ -19,90 +22,111 @@ from sam_invoice.models.crud_company import get_company
 from sam_invoice.models.invoice import Invoice
 
 
-class InvoicePDFGenerator:
-    """Generates PDF invoices."""
-
-    def __init__(self, output_path: Path):
-        self.output_path = output_path
-        self.styles = getSampleStyleSheet()
-        self._setup_styles()
-
-    def _setup_styles(self):
-        """Define custom styles for the invoice."""
-        self.styles.add(
-            ParagraphStyle(
-                name="CompanyName",
-                parent=self.styles["Heading1"],
-                fontSize=16,
-                textColor=colors.HexColor("#2c3e50"),
-                spaceAfter=2,
-            )
+@functools.cache
+def _build_styles():
+    """Build the invoice style sheet (built once per process, read-only afterwards)."""
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            name="CompanyName",
+            parent=styles["Heading1"],
+            fontSize=16,
+            textColor=colors.HexColor("#2c3e50"),
+            spaceAfter=2,
         )
-        self.styles.add(
-            ParagraphStyle(
-                name="CompanyInfo",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                textColor=colors.HexColor("#7f8c8d"),
-                leading=11,
-            )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="CompanyInfo",
+            parent=styles["Normal"],
+            fontSize=9,
+            textColor=colors.HexColor("#7f8c8d"),
+            leading=11,
         )
-        self.styles.add(
-            ParagraphStyle(
-                name="InvoiceTitle",
-                parent=self.styles["Heading1"],
-                fontSize=24,
-                textColor=colors.HexColor("#2c3e50"),
-                alignment=TA_RIGHT,
-                spaceAfter=20,
-            )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="InvoiceTitle",
+            parent=styles["Heading1"],
+            fontSize=24,
+            textColor=colors.HexColor("#2c3e50"),
+            alignment=TA_RIGHT,
+            spaceAfter=20,
         )
-        self.styles.add(
-            ParagraphStyle(
-                name="ClientName",
-                parent=self.styles["Heading2"],
-                fontSize=12,
-                textColor=colors.black,
-                spaceAfter=2,
-            )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="ClientName",
+            parent=styles["Heading2"],
+            fontSize=12,
+            textColor=colors.black,
+            spaceAfter=2,
         )
-        self.styles.add(
-            ParagraphStyle(
-                name="ClientAddress",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                leading=12,
-            )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="ClientAddress",
+            parent=styles["Normal"],
+            fontSize=10,
+            leading=12,
         )
-        self.styles.add(
-            ParagraphStyle(
-                name="TableHeader",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                textColor=colors.white,
-                alignment=TA_CENTER,
-            )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="TableHeader",
+            parent=styles["Normal"],
+            fontSize=9,
+            textColor=colors.white,
+            alignment=TA_CENTER,
         )
-        self.styles.add(
-            ParagraphStyle(
-                name="TableItem",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                textColor=colors.black,
-            )
-        )
-        self.styles.add(
-            ParagraphStyle(
-                name="TableNumber",
-                parent=self.styles["Normal"],
-                fontSize=9,
-                textColor=colors.black,
-                alignment=TA_RIGHT,
-            )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="TableItem",
+            parent=styles["Normal"],
+            fontSize=9,
+            textColor=colors.black,
         )
+    )
+    return styles
+
+
+@functools.cache
+def _header_row() -> tuple[Paragraph, ...]:
+    """Build the items table header cells (constant, built once per process)."""
+    header_style = _build_styles()["TableHeader"]
+    return tuple(Paragraph(h, header_style) for h in ("Description", "Qty", "Unit Price", "Total"))
+
+
+class InvoicePDFGenerator:
+    """Generates PDF invoices."""
+
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self.styles = _build_styles()
 
     def generate(self, invoice: Invoice):
         """Generate the PDF for the given invoice."""
+        self._build(self._build_story(invoice, get_company()))
+
+    def generate_many(self, invoices: list[Invoice]):
+        """Generate a single PDF containing several invoices.
+
+        The company is fetched once and each invoice starts on a new page.
+
+        Args:
+            invoices: Invoices to include, in order
+        """
+        company = get_company()
+        story = []
+        for invoice in invoices:
+            if story:
+                story.append(PageBreak())
+            story.extend(self._build_story(invoice, company))
+        self._build(story)
+
+    def _build(self, story: list):
+        """Lay out the flowables and write the PDF to the output path."""
         doc = SimpleDocTemplate(
             str(self.output_path),
             pagesize=A4,
@@ -111,9 +135,19 @@ class InvoicePDFGenerator:
             topMargin=2 * cm,
             bottomMargin=2 * cm,
         )
+        doc.build(story)
+
+    def _build_story(self, invoice: Invoice, company) -> list:
+        """Build the flowables of one invoice.
+
+        Args:
+            invoice: The invoice, with its items loaded
+            company: Company record for the header, or None
 
+        Returns:
+            List of flowables for the invoice
+        """
         story = []
-        company = get_company()
 
         # --- Header Section ---
         # Left: Company Info
@@ -121,8 +155,8 @@ class InvoicePDFGenerator:
         if company:
             company_data.append(Paragraph(company.name, self.styles["CompanyName"]))
             if company.address:
-                for line in company.address.split("\n"):
-                    company_data.append(Paragraph(line, self.styles["CompanyInfo"]))
+                # One paragraph for the whole block, lines broken with <br/>
+                company_data.append(Paragraph(company.address.replace("\n", "<br/>"), self.styles["CompanyInfo"]))
             if company.email:
                 company_data.append(Paragraph(f"Email: {company.email}", self.styles["CompanyInfo"]))
             if company.phone:
@@ -158,31 +192,30 @@ class InvoicePDFGenerator:
         story.append(Paragraph("Bill To:", self.styles["CompanyInfo"]))
         story.append(Paragraph(invoice.customer_name, self.styles["ClientName"]))
         if invoice.customer_address:
-            for line in invoice.customer_address.split("\n"):
-                story.append(Paragraph(line, self.styles["ClientAddress"]))
+            story.append(Paragraph(invoice.customer_address.replace("\n", "<br/>"), self.styles["ClientAddress"]))
 
         story.append(Spacer(1, 1 * cm))
 
         # --- Items Table ---
-        data = []
-        # Headers
-        headers = ["Description", "Qty", "Unit Price", "Total"]
-        data.append([Paragraph(h, self.styles["TableHeader"]) for h in headers])
-
-        # Rows
-        for item in invoice.items:
-            data.append(
-                [
-                    Paragraph(item.product_name, self.styles["TableItem"]),
-                    Paragraph(str(item.quantity), self.styles["TableNumber"]),
-                    Paragraph(f"{item.unit_price:.2f}", self.styles["TableNumber"]),
-                    Paragraph(f"{item.total_price:.2f}", self.styles["TableNumber"]),
-                ]
-            )
+        data = [list(_header_row())]
+
+        # Rows: only the description is a Paragraph (it wraps and takes markup);
+        # numbers are plain strings, styled by the table commands below
+        item_style = self.styles["TableItem"]
+        data.extend(
+            [
+                Paragraph(item.product_name, item_style),
+                str(item.quantity),
+                f"{item.unit_price:.2f}",
+                f"{item.total_price:.2f}",
+            ]
+            for item in invoice.items
+        )
 
         # Table Style
         col_widths = [9 * cm, 2 * cm, 3 * cm, 3 * cm]
-        table = Table(data, colWidths=col_widths)
+        # LongTable splits long item lists across pages cheaply, repeating the header
+        table = LongTable(data, colWidths=col_widths, repeatRows=1)
 
         # Modern Table Styling
         ts = TableStyle(
@@ -192,6 +225,7 @@ class InvoicePDFGenerator:
                 ("ALIGN", (0, 0), (-1, -1), "LEFT"),
                 ("ALIGN", (1, 0), (-1, -1), "RIGHT"),  # Numbers right aligned
                 ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (1, 1), (-1, -1), 9),
                 ("BOTTOMPADDING", (0, 0), (-1, 0), 8),
                 ("TOPPADDING", (0, 0), (-1, 0), 8),
                 ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#ecf0f1")),
@@ -222,6 +256,4 @@ class InvoicePDFGenerator:
             )
         )
         story.append(totals_table)
-
-        # Build PDF
-        doc.build(story)
+        return story
@@ -3,15 +3,13 @@
 from abc import ABCMeta, abstractmethod
 from typing import Any
 
-import qtawesome as qta
-from PySide6.QtCore import QSize, Qt, QThread, QTimer, Signal
+from PySide6.QtCore import QModelIndex, Qt, QTimer, Signal
 from PySide6.QtGui import QFont, QPalette
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QSplitter,
     QVBoxLayout,
     QWidget,
@@ -19,8 +17,12 @@ from PySide6.QtWidgets import (
 
 from sam_invoice.ui.widget_helpers import (
     ClickableLabel,
+    ResultsListModel,
     SearchWorker,
     create_icon_button,
+    get_icon,
+    get_icon_pixmap,
+    get_search_thread,
 )
 
 
@@ -170,8 +172,7 @@ class BaseDetailWidget(QWidget, metaclass=QABCMeta):
         }
 
         icon_key = icon_map.get(icon_name, "fa5s.file")
-        icon = qta.icon(icon_key, color=icon_color)
-        pix = icon.pixmap(QSize(96, 96))
+        pix = get_icon_pixmap(icon_key, 96, icon_color)
         if not pix.isNull():
             self._avatar.setPixmap(pix)
 
@@ -249,19 +250,18 @@ class BaseListView(QWidget, metaclass=QABCMeta):
     """
 
     item_selected = Signal(object)
-    search_requested = Signal(str, int)
+    search_requested = Signal(str, int, int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Background search worker configuration
-        self._search_thread = QThread(self)
-        self._search_worker = SearchWorker(self._search_function)
-        self._search_worker.moveToThread(self._search_thread)
+        # Background search worker configuration (thread shared by all views)
+        self._query_seq = 0  # Sequence number of the latest search request
+        self._search_worker = SearchWorker(self._search_or_list)
+        self._search_worker.moveToThread(get_search_thread())
         self._search_worker.results_ready.connect(self._on_search_results)
         self._search_worker.error.connect(lambda e: print(f"[search error] {e}"))
         self.search_requested.connect(self._search_worker.search)
-        self._search_thread.start()
 
         # Timer for search debounce
         self._search_timer = QTimer(self)
@@ -279,14 +279,18 @@ class BaseListView(QWidget, metaclass=QABCMeta):
 
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText(self._search_placeholder())
-        self.search_box.addAction(qta.icon("fa5s.search", color="#444444"), QLineEdit.LeadingPosition)
+        self.search_box.addAction(get_icon("fa5s.search"), QLineEdit.LeadingPosition)
 
         self._results_count_label = QLabel("")
         self._results_count_label.setStyleSheet("color: #666; font-size:11px; padding:4px 0;")
         self._results_count_label.setAlignment(Qt.AlignRight)
 
-        self._results_list = QListWidget()
-        self._results_list.setSelectionMode(QListWidget.SingleSelection)
+        # Items live in a model formatting rows on demand (no per-row items)
+        self._results_model = ResultsListModel(self._format_list_item, self)
+        self._results_list = QListView()
+        self._results_list.setModel(self._results_model)
+        self._results_list.setSelectionMode(QListView.SingleSelection)
+        self._results_list.setUniformItemSizes(True)
 
         left_layout.addWidget(self.search_box)
         left_layout.addWidget(self._results_count_label)
@@ -332,47 +336,46 @@ class BaseListView(QWidget, metaclass=QABCMeta):
         self._detail_widget.item_saved.connect(self._on_saved)
         self._detail_widget.item_deleted.connect(self._on_deleted)
         self.search_box.textChanged.connect(self._on_search_text_changed)
-        self._results_list.itemActivated.connect(self._on_item_activated)
-        self._results_list.itemClicked.connect(self._on_item_activated)
-        self._results_list.currentItemChanged.connect(lambda cur, prev: self._on_item_activated(cur) if cur else None)
+        self._results_list.activated.connect(self._on_item_activated)
+        self._results_list.clicked.connect(self._on_item_activated)
+        self._results_list.selectionModel().currentChanged.connect(
+            lambda cur, prev: self._on_item_activated(cur) if cur.isValid() else None
+        )
         self._add_btn.clicked.connect(self._on_add_item)
 
-        # Load initial data after complete initialization
-        QTimer.singleShot(0, self.reload_items)
+        # Load initial data in the background worker, off the UI thread
+        self._request_search("", 0)
 
     def closeEvent(self, event):
         """Cleanup resources when widget is closed."""
-        self._cleanup_thread()
+        self._cancel_searches()
         super().closeEvent(event)
 
     def __del__(self):
         """Cleanup resources when widget is destroyed."""
-        self._cleanup_thread()
+        self._cancel_searches()
 
-    def _cleanup_thread(self):
-        """Stop and wait for search thread to finish."""
+    def _cancel_searches(self):
+        """Stop the debounce timer and drop pending searches.
+
+        The search thread is shared by all views and stopped when the
+        application quits.
+        """
         try:
-            if hasattr(self, "_search_thread") and self._search_thread:
-                if self._search_thread.isRunning():
-                    # Stop the timer to prevent new searches
-                    if hasattr(self, "_search_timer"):
-                        self._search_timer.stop()
-
-                    # Request thread to quit
-                    self._search_thread.quit()
-
-                    # Wait with a reasonable timeout
-                    if not self._search_thread.wait(500):  # 500ms timeout
-                        # If thread doesn't quit, terminate it forcefully
-                        self._search_thread.terminate()
-                        self._search_thread.wait()
+            # Stop the timer to prevent new searches
+            if hasattr(self, "_search_timer"):
+                self._search_timer.stop()
+
+            # Pending requests become stale: the worker skips them
+            if hasattr(self, "_search_worker"):
+                self._next_query_seq()
         except RuntimeError:
             # Qt object may already be deleted, that's OK
             pass
 
     def cleanup(self):
         """Public cleanup method for external callers."""
-        self._cleanup_thread()
+        self._cancel_searches()
 
     @abstractmethod
     def _search_placeholder(self) -> str:
@@ -394,6 +397,10 @@ class BaseListView(QWidget, metaclass=QABCMeta):
         """Retrieve all items from the database."""
         pass
 
+    def _count_all_items(self) -> int:
+        """Count all items in the database (override with a COUNT query)."""
+        return len(self._get_all_items())
+
     @abstractmethod
     def _format_list_item(self, item: Any) -> str:
         """Format an item for display in the list."""
@@ -423,68 +430,93 @@ class BaseListView(QWidget, metaclass=QABCMeta):
         if not q:
             self.reload_items()
         else:
-            self.search_requested.emit(q, 50)
+            self._request_search(q, 50)
+
+    def _fill_list(self, items: list):
+        """Replace the list contents with items (a single model reset)."""
+        self._results_model.set_items(items)
+
+    def _select_first(self):
+        """Make the first row current, which activates its item."""
+        self._results_list.setCurrentIndex(self._results_model.index(0))
 
-    def _on_search_results(self, rows: list):
+    def _search_or_list(self, query: str, limit: int) -> list:
+        """Search items, or list them all for an empty query (runs in the worker)."""
+        if not query:
+            return self._get_all_items()
+        return self._search_function(query, limit=limit)
+
+    def _next_query_seq(self) -> int:
+        """Start a new search generation, making pending requests stale."""
+        self._query_seq += 1
+        self._search_worker.latest_seq = self._query_seq
+        return self._query_seq
+
+    def _request_search(self, q: str, limit: int):
+        """Ask the worker for results, superseding any request still pending."""
+        self.search_requested.emit(q, limit, self._next_query_seq())
+
+    def _on_search_results(self, result: tuple):
         """Handle search results from worker."""
-        max_shown = 50
-        rows_limited = rows[:max_shown]
+        seq, rows = result
+        # Ignore answers to requests superseded since (typing, reload_items)
+        if seq != self._query_seq:
+            return
 
-        self._results_list.clear()
-        for item in rows_limited:
-            disp = self._format_list_item(item)
-            list_item = QListWidgetItem(disp)
-            list_item.setData(Qt.ItemDataRole.UserRole, item)  # Store complete object
-            self._results_list.addItem(list_item)
+        # An empty search box means the worker listed every item
+        if not self.search_box.text().strip():
+            self._show_items(rows)
+            return
+
+        # The worker already limited the rows to the 50 shown
+        self._fill_list(rows)
 
         # Select first result
-        if self._results_list.count() > 0:
-            self._results_list.setCurrentRow(0)
-            self._on_item_activated(self._results_list.item(0))
+        if self._results_model.rowCount() > 0:
+            self._select_first()
         else:
             # No results: disable delete button
             self._detail_widget._delete_btn.setEnabled(False)
 
         # Update counter
         try:
-            total = len(self._get_all_items())
-            shown = len(rows_limited)
+            total = self._count_all_items()
+            shown = len(rows)
             self._results_count_label.setText(f"{shown} / {total} résultats")
         except Exception:
             self._results_count_label.setText("")
 
     def reload_items(self, select_first: bool = True):
         """Reload item list from database."""
+        # Any search still in flight is now stale
+        self._next_query_seq()
+
         try:
             items = self._get_all_items()
         except Exception:
             items = []
 
-        self._results_list.clear()
-        for item in items:
-            disp = self._format_list_item(item)
-            list_item = QListWidgetItem(disp)
-            list_item.setData(Qt.ItemDataRole.UserRole, item)  # Store complete object
-            self._results_list.addItem(list_item)
+        self._show_items(items, select_first)
+
+    def _show_items(self, items: list, select_first: bool = True):
+        """Fill the list with all items and update the counter."""
+        self._fill_list(items)
 
         total = len(items)
         shown = min(total, 50)
         self._results_count_label.setText(f"{shown} / {total} results")
 
-        if select_first and self._results_list.count() > 0:
-            first_item = self._results_list.item(0)
-            self._results_list.setCurrentRow(0)
-            if first_item:
-                self._on_item_activated(first_item)
-        elif self._results_list.count() == 0:
+        if select_first and self._results_model.rowCount() > 0:
+            self._select_first()
+        elif self._results_model.rowCount() == 0:
             # No item: clear detail widget and disable delete button
             if hasattr(self._detail_widget, "clear"):
                 self._detail_widget.clear()
             self._detail_widget._delete_btn.setEnabled(False)
 
     @abstractmethod
-    def _on_item_activated(self, item: QListWidgetItem):
-        """Handle item selection in the list."""
+    def _on_item_activated(self, item: QModelIndex):
+        """Handle item selection in the list (object under UserRole)."""
         pass
 
     @abstractmethod
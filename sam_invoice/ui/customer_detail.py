@@ -1,11 +1,10 @@
 """Customer detail widget using the base class."""
 
-from datetime import date
-
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QMessageBox
 
 from sam_invoice.ui.base_widgets import BaseDetailWidget
+from sam_invoice.ui.widget_helpers import get_icon
 
 
 class CustomerDetailWidget(BaseDetailWidget):
@@ -31,7 +30,6 @@ class CustomerDetailWidget(BaseDetailWidget):
         self._finalize_layout()
 
         # Add last order and invoice sections AFTER finalize (full width in main layout)
-        import qtawesome as qta
         from PySide6.QtCore import QSize
         from PySide6.QtWidgets import (
             QGroupBox,
@@ -66,7 +64,7 @@ class CustomerDetailWidget(BaseDetailWidget):
 
         # Create Invoice button (icon only)
         self._invoice_btn = QPushButton()
-        self._invoice_btn.setIcon(qta.icon("fa5s.plus", color="#2196F3"))
+        self._invoice_btn.setIcon(get_icon("fa5s.plus", "#2196F3"))
         self._invoice_btn.setIconSize(QSize(20, 20))
         self._invoice_btn.setToolTip("Create Invoice")
         self._invoice_btn.setEnabled(False)
@@ -201,12 +199,24 @@ class CustomerDetailWidget(BaseDetailWidget):
             self._invoice_btn.setEnabled(self._current_id is not None)
 
             # Load invoice history and last order
-            self._load_invoices_for_customer(cust.id)
-            self._load_last_order_items(cust.id)
+            self._load_customer_invoices(cust.id)
+
+    def _load_customer_invoices(self, customer_id):
+        """Load this customer's invoices once for the history and last order."""
+        from sam_invoice.models.crud_invoice import invoice_crud
+
+        try:
+            # Newest first, with their items
+            invoices = invoice_crud.get_for_customer(customer_id)
+        except Exception as e:
+            print(f"Error loading invoices: {e}")
+            invoices = []
+
+        self._load_invoices_for_customer(invoices)
+        self._load_last_order_items(invoices)
 
-    def _load_invoices_for_customer(self, customer_id):
-        """Load and display invoices for this customer."""
-        import qtawesome as qta
+    def _load_invoices_for_customer(self, invoices):
+        """Display the invoice history of this customer."""
         from PySide6.QtCore import QSize, Qt
         from PySide6.QtWidgets import (
             QHBoxLayout,
@@ -216,15 +226,7 @@ class CustomerDetailWidget(BaseDetailWidget):
             QWidget,
         )
 
-        from sam_invoice.models.crud_invoice import invoice_crud
-
         try:
-            # Search invoices by customer ID
-            invoices = invoice_crud.get_for_customer(customer_id)
-
-            # Sort by date descending (newest first)
-            invoices = sorted(invoices, key=lambda x: x.date if x.date else date.min, reverse=True)
-
             self._invoices_list.clear()
             for inv in invoices:
                 # Create list item
@@ -244,7 +246,7 @@ class CustomerDetailWidget(BaseDetailWidget):
 
                 # Edit button
                 edit_btn = QPushButton()
-                edit_btn.setIcon(qta.icon("fa5s.edit", color="#FFC107"))
+                edit_btn.setIcon(get_icon("fa5s.edit", "#FFC107"))
                 edit_btn.setIconSize(QSize(16, 16))
                 edit_btn.setToolTip("Edit")
                 edit_btn.setFixedSize(28, 28)
@@ -253,7 +255,7 @@ class CustomerDetailWidget(BaseDetailWidget):
 
                 # PDF button
                 pdf_btn = QPushButton()
-                pdf_btn.setIcon(qta.icon("fa5s.file-pdf", color="#F44336"))
+                pdf_btn.setIcon(get_icon("fa5s.file-pdf", "#F44336"))
                 pdf_btn.setIconSize(QSize(16, 16))
                 pdf_btn.setToolTip("View PDF")
                 pdf_btn.setFixedSize(28, 28)
@@ -273,20 +275,13 @@ class CustomerDetailWidget(BaseDetailWidget):
         except Exception as e:
             print(f"Error loading invoices: {e}")
 
-    def _load_last_order_items(self, customer_id):
-        """Load and display items from the last order."""
-        from sam_invoice.models.crud_invoice import invoice_crud
-
+    def _load_last_order_items(self, invoices):
+        """Display the items of the last order."""
         try:
-            # Get all invoices for this customer
-            invoices = invoice_crud.get_for_customer(customer_id)
-
             if not invoices:
                 self._last_order_label.setText("No orders yet")
                 return
 
-            # Sort by date descending
-            invoices = sorted(invoices, key=lambda x: x.date if x.date else date.min, reverse=True)
             last_invoice = invoices[0]
 
             # Format items display
@@ -295,10 +290,7 @@ class CustomerDetailWidget(BaseDetailWidget):
             else:
                 items_text = []
                 for item in last_invoice.items:
-                    # Assuming item has product_name and quantity
-                    name = getattr(item, "product_name", "Unknown Product")
-                    qty = getattr(item, "quantity", 0)
-                    items_text.append(f"• {name} (Qty: {qty})")
+                    items_text.append(f"• {item.product_name} (Qty: {item.quantity})")
 
                 date_str = last_invoice.date.strftime("%d.%m.%Y") if last_invoice.date else "Unknown Date"
                 text = f"<b>Last Order ({date_str}):</b><br>" + "<br>".join(items_text)
@@ -328,8 +320,7 @@ class CustomerDetailWidget(BaseDetailWidget):
         dialog = InvoiceEditDialog(self, invoice=invoice)
         if dialog.exec():
             # Reload invoices after editing
-            self._load_invoices_for_customer(self._current_customer.name)
-            self._load_last_order_items(self._current_customer.name)
+            self._load_customer_invoices(self._current_id)
 
     def _on_view_invoice_from_list(self, invoice):
         """View a specific invoice from the list."""
@@ -377,6 +368,5 @@ class CustomerDetailWidget(BaseDetailWidget):
 
         if dialog.exec():
             # Reload invoices after creation
-            self._load_invoices_for_customer(self._current_customer.name)
-            self._load_last_order_items(self._current_customer.name)
+            self._load_customer_invoices(self._current_id)
             return
@@ -23,8 +23,8 @@ class CustomerView(BaseListView):
 
     def _search_function(self, query: str, limit: int):
         """Search function for customers."""
-        rows = customer_crud.search(query, limit=limit)
-        return sorted(rows, key=lambda c: (getattr(c, "name", "") or "").lower())
+        # Already ordered by name (case-insensitive) in SQL
+        return customer_crud.search_rows(query, limit=limit)
 
     def _create_detail_widget(self):
         """Create the customer detail widget."""
@@ -34,12 +34,16 @@ class CustomerView(BaseListView):
 
     def _get_all_items(self):
         """Get all customers."""
-        return customer_crud.get_all()
+        return customer_crud.get_all_rows()
+
+    def _count_all_items(self) -> int:
+        """Count all customers."""
+        return customer_crud.count()
 
     def _format_list_item(self, customer) -> str:
         """Format a customer for display in the list."""
-        name = getattr(customer, "name", "") or "(no name)"
-        email = getattr(customer, "email", "")
+        name = customer.name or "(no name)"
+        email = customer.email
         if email:
             return f"{name} ({email})"
         return name
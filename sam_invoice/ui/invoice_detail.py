@@ -3,13 +3,12 @@
 import tempfile
 from pathlib import Path
 
-import qtawesome as qta
-from PySide6.QtCore import QSize, Qt, Signal
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtPdf import QPdfDocument
 from PySide6.QtPdfWidgets import QPdfView
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QTabWidget, QVBoxLayout, QWidget
 
-from sam_invoice.tools.pdf_generator import InvoicePDFGenerator
+from sam_invoice.ui.widget_helpers import create_icon_button, get_icon_pixmap
 
 
 class InvoiceDetailWidget(QWidget):
@@ -24,8 +23,6 @@ class InvoiceDetailWidget(QWidget):
         self._current_invoice = None
 
         # Required attributes for BaseListView compatibility
-        from sam_invoice.ui.widget_helpers import create_icon_button
-
         self._delete_btn = create_icon_button("fa5s.trash", "Delete")
         self._delete_btn.setEnabled(False)  # Invoices are read-only
         self._delete_btn.setVisible(False)  # Hide since not used
@@ -48,9 +45,7 @@ class InvoiceDetailWidget(QWidget):
         self._icon_label = QLabel()
         self._icon_label.setFixedSize(96, 96)
         self._icon_label.setAlignment(Qt.AlignCenter)
-        icon = qta.icon("fa5s.file-invoice-dollar", color="#444444")
-        pix = icon.pixmap(QSize(96, 96))
-        self._icon_label.setPixmap(pix)
+        self._icon_label.setPixmap(get_icon_pixmap("fa5s.file-invoice-dollar", 96))
         left_layout.addWidget(self._icon_label, alignment=Qt.AlignHCenter | Qt.AlignTop)
         left_layout.addStretch()
 
@@ -131,6 +126,9 @@ class InvoiceDetailWidget(QWidget):
         if not self._current_invoice:
             return
 
+        # ReportLab is only imported with the first preview, not at startup
+        from sam_invoice.tools.pdf_generator import InvoicePDFGenerator
+
         # Generate PDF to temp file
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
             tmp_path = Path(tmp.name)
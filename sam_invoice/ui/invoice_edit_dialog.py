@@ -2,7 +2,7 @@
 
 from datetime import date, timedelta
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QStringListModel, Qt, Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QCompleter,
@@ -243,7 +243,7 @@ class InvoiceEditDialog(QDialog):
     def _load_customers(self):
         """Load customers into dropdown."""
         try:
-            customers = customer_crud.get_all()
+            customers = customer_crud.get_all_rows()
             self.client_combo.addItem("-- Select Client --", None)
             self.visible_client_combo.addItem("-- Select Client --", None)
             for customer in customers:
@@ -283,19 +283,17 @@ class InvoiceEditDialog(QDialog):
     def _generate_next_reference(self):
         """Generate next invoice reference."""
         try:
-            invoices = invoice_crud.get_all()
             year = date.today().year
 
             # Find max number for current year
             max_num = 0
             prefix = f"INV-{year}-"
-            for inv in invoices:
-                if inv.reference and inv.reference.startswith(prefix):
-                    try:
-                        num = int(inv.reference.replace(prefix, ""))
-                        max_num = max(max_num, num)
-                    except ValueError:
-                        pass
+            for reference in invoice_crud.get_references(prefix):
+                try:
+                    num = int(reference.replace(prefix, ""))
+                    max_num = max(max_num, num)
+                except ValueError:
+                    pass
 
             return f"{prefix}{max_num + 1:03d}"
         except Exception:
@@ -313,14 +311,13 @@ class InvoiceEditDialog(QDialog):
         try:
             if not hasattr(self, "_products_by_name"):
                 # Load products once if not already loaded
-                products = product_crud.get_all()
+                products = product_crud.get_all_rows()
                 self._products_by_name = {p.name: p for p in products if p.name}
+                # One names model shared by the completers of every row
+                self._product_names_model = QStringListModel(list(self._products_by_name), self)
 
             if self._products_by_name:
-                completer = QCompleter(list(self._products_by_name.keys()))
-                completer.setCaseSensitivity(Qt.CaseInsensitive)
-                completer.setFilterMode(Qt.MatchContains)  # Better matching
-                desc_edit.setCompleter(completer)
+                desc_edit.setCompleter(self._create_product_completer(desc_edit))
 
                 # Auto-fill price when product selected
                 desc_edit.textChanged.connect(lambda text, r=row: self._on_product_selected(r, text))
@@ -357,6 +354,13 @@ class InvoiceEditDialog(QDialog):
 
         self._update_totals()
 
+    def _create_product_completer(self, parent) -> QCompleter:
+        """Create a product name completer over the shared names model."""
+        completer = QCompleter(self._product_names_model, parent)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)  # Better matching
+        return completer
+
     def _on_product_selected(self, row, product_name):
         """Auto-fill price when a product is selected from autocomplete."""
         if not hasattr(self, "_products_by_name"):
@@ -440,9 +444,7 @@ class InvoiceEditDialog(QDialog):
             # Setup autocomplete
             try:
                 if hasattr(self, "_products_by_name"):
-                    completer = QCompleter(list(self._products_by_name.keys()))
-                    completer.setCaseSensitivity(Qt.CaseInsensitive)
-                    desc_edit.setCompleter(completer)
+                    desc_edit.setCompleter(self._create_product_completer(desc_edit))
                     desc_edit.textChanged.connect(lambda text, r=row: self._on_product_selected(r, text))
             except Exception:
                 pass
@@ -450,6 +452,8 @@ class InvoiceEditDialog(QDialog):
             # Store product_id if present
             if item.product_id:
                 desc_edit.setProperty("product_id", item.product_id)
+            # Saving updates this item instead of recreating it
+            desc_edit.setProperty("item_id", item.id)
 
             self.items_table.setCellWidget(row, 0, desc_edit)
 
@@ -513,6 +517,7 @@ class InvoiceEditDialog(QDialog):
                         "unit_price": unit_price,
                         "total_price": total_price,
                         "product_id": product_id,  # Include product reference
+                        "id": desc_widget.property("item_id"),
                     }
                 )
 
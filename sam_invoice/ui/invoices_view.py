@@ -1,7 +1,5 @@
 """Invoices view using the base class."""
 
-from datetime import date
-
 from PySide6.QtCore import Qt, Signal
 
 from sam_invoice.models.crud_invoice import invoice_crud
@@ -18,6 +16,10 @@ class InvoicesView(BaseListView):
 
     invoice_selected = Signal(object)
 
+    # Listed invoice currently shown in the detail (list rows are replaced on
+    # every search or reload, so a stale one is never matched)
+    _shown_listed_invoice = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         # Hide "New" button - invoices are created from customer view
@@ -29,8 +31,8 @@ class InvoicesView(BaseListView):
 
     def _search_function(self, query: str, limit: int):
         """Search function for invoices."""
-        rows = invoice_crud.search(query, limit=limit)
-        return sorted(rows, key=lambda i: i.date, reverse=True)
+        # Already ordered by date (most recent first) in SQL
+        return invoice_crud.search(query, limit=limit)
 
     def _create_detail_widget(self):
         """Create the invoice detail widget."""
@@ -40,10 +42,8 @@ class InvoicesView(BaseListView):
     def _get_all_items(self):
         """Get all invoices (limited to 100 most recent for performance)."""
         try:
-            items = invoice_crud.get_all()
-            # Limit to 100 most recent for performance
-            items_sorted = sorted(items, key=lambda i: i.date if i.date else date(1900, 1, 1), reverse=True)
-            return items_sorted[:100]
+            # Limit to 100 most recent for performance (sorted and limited in SQL)
+            return invoice_crud.search("", limit=100)
         except Exception as e:
             print(f"Error loading invoices: {e}")
             import traceback
@@ -51,11 +51,15 @@ class InvoicesView(BaseListView):
             traceback.print_exc()
             return []
 
+    def _count_all_items(self) -> int:
+        """Count listed invoices (the list holds the 100 most recent)."""
+        return min(invoice_crud.count(), 100)
+
     def _format_list_item(self, invoice) -> str:
         """Format an invoice for display in the list."""
-        ref = getattr(invoice, "ref", "") or "(no ref)"
-        client = getattr(invoice, "customer_name", "")
-        date = getattr(invoice, "date", None)
+        ref = invoice.reference or "(no ref)"
+        client = invoice.customer_name
+        date = invoice.date
         date_str = date.strftime("%d.%m.%Y") if date else ""
 
         if client and date_str:
@@ -78,7 +82,14 @@ class InvoicesView(BaseListView):
         """Callback when an item is activated."""
         if not item:
             return
-        selected_invoice = item.data(Qt.ItemDataRole.UserRole)
+        listed_invoice = item.data(Qt.ItemDataRole.UserRole)
+        # One click reports the row up to three times (current, clicked, activated)
+        if listed_invoice is self._shown_listed_invoice:
+            return
+        self._shown_listed_invoice = listed_invoice
+
+        # Listed invoices come without their items, fetch them for the detail
+        selected_invoice = invoice_crud.get_by_id(listed_invoice.id)
         self._detail_widget.set_invoice(selected_invoice)
         self.invoice_selected.emit(selected_invoice)
 
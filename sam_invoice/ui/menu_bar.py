@@ -6,7 +6,6 @@ from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QFileDialog, QMainWindow, QMessageBox
 
 from sam_invoice.models import database
-from sam_invoice.ui.preferences_dialog import PreferencesDialog
 
 
 def create_menu_bar(window: QMainWindow) -> None:
@@ -164,6 +163,9 @@ def _remove_from_recent_files(window: QMainWindow, db_path: Path) -> None:
 
 def _open_preferences(window: QMainWindow) -> None:
     """Open the preferences dialog."""
+    # Imported on first use: the dialog is rarely opened
+    from sam_invoice.ui.preferences_dialog import PreferencesDialog
+
     dialog = PreferencesDialog(window)
     dialog.exec()
 
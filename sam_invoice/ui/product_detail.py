@@ -121,33 +121,46 @@ class ProductDetailWidget(BaseDetailWidget):
             self._edit_btn.setVisible(False)
             self._delete_btn.setEnabled(False)
         else:
-            # Store raw values
-            self._raw_values = {
+            raw_values = {
                 "reference": getattr(art, "reference", ""),
                 "name": getattr(art, "name", ""),
                 "price": str(getattr(art, "price", 0.0)),
                 "stock": str(getattr(art, "stock", 0)),
                 "sold": str(getattr(art, "sold", 0)),
             }
+            # A click also changes the current row: only redraw the labels when
+            # the product shown changed, the buttons are always restored below
+            if raw_values != self._raw_values or not self._edit_btn.isEnabled():
+                self._display_values(art, raw_values)
 
-            # Display product data with formatting
-            self._fields["reference"][0].setText(self._raw_values["reference"])
-            self._fields["name"][0].setText(self._raw_values["name"])
+            self._edit_btn.setEnabled(True)
+            self._edit_btn.setVisible(True)
+            self._delete_btn.setEnabled(self._current_id is not None)
 
-            # Formatted price
-            price = getattr(art, "price", 0.0)
-            self._fields["price"][0].setText(f"Price: {price:.2f} €" if price else "")
+    def _display_values(self, art, raw_values: dict):
+        """Fill the view-mode labels of a product.
 
-            # Stock and sold
-            stock = getattr(art, "stock", 0)
-            self._fields["stock"][0].setText(f"Stock: {stock}")
+        Args:
+            art: The product to display
+            raw_values: Unformatted field values, kept for the edit mode
+        """
+        # Store raw values
+        self._raw_values = raw_values
 
-            sold = getattr(art, "sold", 0)
-            self._fields["sold"][0].setText(f"Sold: {sold}")
+        # Display product data with formatting
+        self._fields["reference"][0].setText(raw_values["reference"])
+        self._fields["name"][0].setText(raw_values["name"])
 
-            self._edit_btn.setEnabled(True)
-            self._edit_btn.setVisible(True)
-            self._delete_btn.setEnabled(self._current_id is not None)
+        # Formatted price
+        price = getattr(art, "price", 0.0)
+        self._fields["price"][0].setText(f"Price: {price:.2f} €" if price else "")
+
+        # Stock and sold
+        stock = getattr(art, "stock", 0)
+        self._fields["stock"][0].setText(f"Stock: {stock}")
+
+        sold = getattr(art, "sold", 0)
+        self._fields["sold"][0].setText(f"Sold: {sold}")
 
     def _enter_edit_mode(self, editing: bool):
         """Toggle between view and edit mode."""
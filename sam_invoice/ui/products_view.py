@@ -23,8 +23,8 @@ class ProductsView(BaseListView):
 
     def _search_function(self, query: str, limit: int):
         """Search function for products."""
-        rows = product_crud.search(query, limit=limit)
-        return sorted(rows, key=lambda a: (getattr(a, "reference", "") or "").lower())
+        # Already ordered by reference (case-insensitive) in SQL
+        return product_crud.search_rows(query, limit=limit)
 
     def _create_detail_widget(self):
         """Create the product detail widget."""
@@ -34,12 +34,16 @@ class ProductsView(BaseListView):
 
     def _get_all_items(self):
         """Get all products."""
-        return product_crud.get_all()
+        return product_crud.get_all_rows()
+
+    def _count_all_items(self) -> int:
+        """Count all products."""
+        return product_crud.count()
 
     def _format_list_item(self, product) -> str:
         """Format an product for display in the list."""
-        reference = getattr(product, "reference", "") or "(no reference)"
-        name = getattr(product, "name", "")
+        reference = product.reference or "(no reference)"
+        name = product.name
         if name:
             return f"{name} ({reference})"
         return reference
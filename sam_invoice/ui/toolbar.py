@@ -2,11 +2,12 @@
 
 import sys
 
-import qtawesome as qta
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMainWindow, QToolBar
 
+from sam_invoice.ui.widget_helpers import get_icon
+
 
 def create_toolbar(window: QMainWindow) -> QToolBar:
     """Create and configure the main toolbar.
@@ -28,10 +29,10 @@ def create_toolbar(window: QMainWindow) -> QToolBar:
     # Dark gray color for all icons
     icon_color = "#444444"
 
-    # Create icons with qtawesome
-    home_icon = qta.icon("fa5s.users", color=icon_color)
-    products_icon = qta.icon("fa5s.wine-bottle", color=icon_color)
-    invoices_icon = qta.icon("fa5s.file-invoice-dollar", color=icon_color)
+    # Create icons with qtawesome (cached across window constructions)
+    home_icon = get_icon("fa5s.users", icon_color)
+    products_icon = get_icon("fa5s.wine-bottle", icon_color)
+    invoices_icon = get_icon("fa5s.file-invoice-dollar", icon_color)
 
     # Create actions
     window.act_home = QAction(home_icon, "Customers", window)
@@ -41,12 +42,10 @@ def create_toolbar(window: QMainWindow) -> QToolBar:
     window.act_invoices = QAction(invoices_icon, "Invoices", window)
     window.act_invoices.setCheckable(True)
 
-    # Store icons (no need for colored variants)
-    window._icon_pairs = {
-        window.act_home: (home_icon, home_icon),
-        window.act_products: (products_icon, products_icon),
-        window.act_invoices: (invoices_icon, invoices_icon),
-    }
+    # Store (normal, active) icons on each action (no need for colored variants)
+    window.act_home._icons = (home_icon, home_icon)
+    window.act_products._icons = (products_icon, products_icon)
+    window.act_invoices._icons = (invoices_icon, invoices_icon)
 
     # Add actions to toolbar
     toolbar.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
@@ -66,10 +65,12 @@ def set_active_toolbar_action(window: QMainWindow, action: QAction) -> None:
     """
     for act in (window.act_home, window.act_products, window.act_invoices):
         is_active = act is action
-        act.setChecked(is_active)
-
-        # Change icon based on active/inactive state
-        pair = window._icon_pairs.get(act)
-        if pair:
-            normal_icon, active_icon = pair
+        # Only touch actions whose state changes (setChecked emits changed/toggled)
+        if act.isChecked() != is_active:
+            act.setChecked(is_active)
+
+        # Change icon based on active/inactive state, only when the action has a
+        # distinct active variant (setIcon repaints the tool button)
+        normal_icon, active_icon = act._icons
+        if active_icon is not normal_icon:
             act.setIcon(active_icon if is_active else normal_icon)
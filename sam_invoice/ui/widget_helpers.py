@@ -1,8 +1,20 @@
 """Helper widgets and utilities for UI components."""
 
 import qtawesome as qta
-from PySide6.QtCore import QObject, QSize, Qt, Signal, Slot
-from PySide6.QtWidgets import QLabel, QPushButton, QVBoxLayout, QWidget
+from PySide6.QtCore import QAbstractListModel, QObject, QSize, Qt, QThread, Signal, Slot
+from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtWidgets import QApplication, QLabel, QPushButton, QVBoxLayout, QWidget
+
+# qtawesome icons already built, keyed by (icon name, color)
+_ICON_CACHE: dict[tuple[str, str], QIcon] = {}
+# Pixmaps already rendered from those icons, keyed by (icon name, color, size)
+_PIXMAP_CACHE: dict[tuple[str, str, int], QPixmap] = {}
+# Icon size of the standard icon-only buttons
+_BUTTON_ICON_SIZE = QSize(16, 16)
+# Background thread shared by all search workers (started on first use)
+_SEARCH_THREAD: QThread | None = None
+# How long quitting waits for a running search before terminating its thread
+_SEARCH_THREAD_STOP_TIMEOUT_MS = 100
 
 
 class ClickableLabel(QLabel):
@@ -15,12 +27,68 @@ class ClickableLabel(QLabel):
         super().mouseDoubleClickEvent(event)
 
 
+class ResultsListModel(QAbstractListModel):
+    """Read-only list model over result objects.
+
+    Display text is formatted on demand, only for the rows a view actually
+    paints, and kept until the items are replaced since views ask for it
+    again on every repaint. The objects themselves are exposed under
+    `Qt.ItemDataRole.UserRole`.
+    """
+
+    def __init__(self, format_func, parent=None):
+        """Initialize the model with a display formatter.
+
+        Args:
+            format_func: Callable function(item) -> str used for display text
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self._format_func = format_func
+        self._items: list = []
+        self._display: dict[int, str] = {}  # Formatted text by row
+
+    def set_items(self, items: list):
+        """Replace all items with a single model reset."""
+        self.beginResetModel()
+        self._items = items
+        self._display = {}
+        self.endResetModel()
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            row = index.row()
+            text = self._display.get(row)
+            if text is None:
+                text = self._display[row] = self._format_func(self._items[row])
+            return text
+        if role == Qt.ItemDataRole.UserRole:
+            return self._items[index.row()]
+        return None
+
+
 class SearchWorker(QObject):
-    """Worker that executes searches in a separate thread."""
+    """Worker that executes searches in a separate thread.
+
+    Each request carries a sequence number, emitted back with its results as
+    a `(seq, rows)` tuple so the caller can drop stale answers. Requests
+    already superseded by a newer one (see `latest_seq`) are skipped, and so
+    are all requests once the application is shutting down.
+    """
 
     results_ready = Signal(object)
     error = Signal(str)
 
+    # Set when the application quits: queued requests are dropped
+    _shutdown = False
+
     def __init__(self, search_func):
         """Initialize the worker with a search function.
 
@@ -29,15 +97,89 @@ class SearchWorker(QObject):
         """
         super().__init__()
         self._search_func = search_func
+        # Sequence number of the most recent request, set by the requesting thread
+        self.latest_seq = 0
 
-    @Slot(str, int)
-    def search(self, q: str, limit: int):
+    @Slot(str, int, int)
+    def search(self, q: str, limit: int, seq: int):
+        if SearchWorker._shutdown or seq < self.latest_seq:
+            return
         try:
             rows = self._search_func(q, limit=limit)
-            self.results_ready.emit(rows)
+            self.results_ready.emit((seq, rows))
         except Exception as e:
             self.error.emit(str(e))
-            self.results_ready.emit([])
+            self.results_ready.emit((seq, []))
+
+
+def get_search_thread() -> QThread:
+    """Return the thread shared by all search workers, starting it on first use.
+
+    The thread runs until the application quits.
+
+    Returns:
+        Running QThread to move SearchWorker instances to
+    """
+    global _SEARCH_THREAD
+    if _SEARCH_THREAD is None:
+        app = QApplication.instance()
+        _SEARCH_THREAD = QThread(app)
+        # A thread stopped earlier in this process left the shutdown flag set
+        SearchWorker._shutdown = False
+        _SEARCH_THREAD.start()
+        app.aboutToQuit.connect(_stop_search_thread)
+    return _SEARCH_THREAD
+
+
+def _stop_search_thread() -> None:
+    """Stop the shared search thread."""
+    global _SEARCH_THREAD
+    thread, _SEARCH_THREAD = _SEARCH_THREAD, None
+    if thread is None:
+        return
+    # Drop queued searches so only a query already running is waited for
+    SearchWorker._shutdown = True
+    thread.quit()
+    if not thread.wait(_SEARCH_THREAD_STOP_TIMEOUT_MS):
+        # A query stuck on a locked database must not hang the exit; the
+        # process ends right after, which releases SQLite's locks
+        thread.terminate()
+        thread.wait()
+
+
+def get_icon(icon_name: str, color: str = "#444444") -> QIcon:
+    """Return a colored qtawesome icon, rendering it only once per process.
+
+    Args:
+        icon_name: Font Awesome icon name (e.g., "fa5s.edit")
+        color: Icon color (default: "#444444")
+
+    Returns:
+        Shared QIcon instance
+    """
+    key = (icon_name, color)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = _ICON_CACHE[key] = qta.icon(icon_name, color=color)
+    return icon
+
+
+def get_icon_pixmap(icon_name: str, size: int, color: str = "#444444") -> QPixmap:
+    """Return a qtawesome icon rendered to a square pixmap, rendering it only once.
+
+    Args:
+        icon_name: Font Awesome icon name (e.g., "fa5s.users")
+        size: Pixmap width and height in pixels
+        color: Icon color (default: "#444444")
+
+    Returns:
+        Shared QPixmap instance
+    """
+    key = (icon_name, color, size)
+    pix = _PIXMAP_CACHE.get(key)
+    if pix is None:
+        pix = _PIXMAP_CACHE[key] = get_icon(icon_name, color).pixmap(QSize(size, size))
+    return pix
 
 
 def create_icon_button(icon_name: str, tooltip: str, color: str = "#444444") -> QPushButton:
@@ -52,8 +194,8 @@ def create_icon_button(icon_name: str, tooltip: str, color: str = "#444444") ->
         QPushButton configured with icon and fixed size
     """
     btn = QPushButton()
-    btn.setIcon(qta.icon(icon_name, color=color))
-    btn.setIconSize(QSize(16, 16))
+    btn.setIcon(get_icon(icon_name, color))
+    btn.setIconSize(_BUTTON_ICON_SIZE)
     btn.setFixedSize(32, 32)
     btn.setToolTip(tooltip)
     return btn
@@ -3,7 +3,20 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 import sam_invoice.models.database as database
-from sam_invoice.models.customer import Base
+from sam_invoice.models.base import Base
+
+
+@pytest.fixture(autouse=True)
+def isolated_database(monkeypatch, tmp_path):
+    """Keep every test away from the working directory's `invoices.db`.
+
+    The shared database manager is reset for the test and restored after,
+    and the working directory is `tmp_path`, so any database opened through
+    the default path is created there.
+    """
+    monkeypatch.chdir(tmp_path)
+    for attr in ("db_path", "engine", "SessionLocal"):
+        monkeypatch.setattr(database.db_manager, attr, None)
 
 
 @pytest.fixture
@@ -21,8 +34,9 @@ def in_memory_db(monkeypatch):
     # TODO: use databasemanager instead of monkeypatch
     engine = create_engine("sqlite:///:memory:")
     Base.metadata.create_all(bind=engine)
-    Session = sessionmaker(bind=engine)
+    Session = sessionmaker(bind=engine, expire_on_commit=False)
     # Monkeypatch sur l'attribut du gestionnaire désormais
+    monkeypatch.setattr(database.db_manager, "engine", engine)
     monkeypatch.setattr(database.db_manager, "SessionLocal", Session)
     try:
         yield
@@ -1,6 +1,5 @@
 import json
 from pathlib import Path
-from types import SimpleNamespace
 
 from typer.testing import CliRunner
 
@@ -10,19 +9,18 @@ runner = CliRunner()
 
 
 def test_db_load_fixtures_monkeypatch(monkeypatch):
-    """Verify `fixtures load-customers` iterates the fixtures and calls create_customer.
+    """Verify `fixtures load-customers` iterates the fixtures and calls create_many.
 
-    We monkeypatch `create_customer` to avoid touching the DB and capture calls.
+    We monkeypatch `create_many` to avoid touching the DB and capture calls.
     """
     calls = []
 
-    def fake_create_customer(name: str, address: str, email: str):
-        idx = len(calls) + 1
-        calls.append((name, address, email))
-        return SimpleNamespace(id=idx, name=name)
+    def fake_create_many(rows: list[dict], session=None):
+        calls.extend((row["name"], row["address"], row["email"]) for row in rows)
+        return len(rows)
 
-    # monkeypatch the customer_crud.create used by the CLI
-    monkeypatch.setattr("sam_invoice.models.crud_customer.customer_crud.create", fake_create_customer)
+    # monkeypatch the customer_crud.create_many used by the CLI
+    monkeypatch.setattr("sam_invoice.models.crud_customer.customer_crud.create_many", fake_create_many)
 
     # run the CLI (uses default fixtures file in project)
     result = runner.invoke(cli_module.app, ["fixtures", "load-customers"], catch_exceptions=False)
@@ -61,19 +59,18 @@ def test_db_init_calls_initdb(monkeypatch):
 
 
 def test_db_load_products_fixtures_monkeypatch(monkeypatch):
-    """Verify `fixtures load-products` iterates the fixtures and calls create_product.
+    """Verify `fixtures load-products` iterates the fixtures and calls create_many.
 
-    We monkeypatch `create_product` to avoid touching the DB and capture calls.
+    We monkeypatch `create_many` to avoid touching the DB and capture calls.
     """
     calls = []
 
-    def fake_create_product(reference: str, name: str, price: float, stock: int, sold: int):
-        idx = len(calls) + 1
-        calls.append((reference, name, price, stock, sold))
-        return SimpleNamespace(id=idx, reference=reference)
+    def fake_create_many(rows: list[dict], session=None):
+        calls.extend((row["reference"], row["name"], row["price"], row["stock"], row["sold"]) for row in rows)
+        return len(rows)
 
-    # monkeypatch the product_crud.create used by the CLI
-    monkeypatch.setattr("sam_invoice.models.crud_product.product_crud.create", fake_create_product)
+    # monkeypatch the product_crud.create_many used by the CLI
+    monkeypatch.setattr("sam_invoice.models.crud_product.product_crud.create_many", fake_create_many)
 
     # run the CLI (uses default fixtures file in project)
     result = runner.invoke(cli_module.app, ["fixtures", "load-products"], catch_exceptions=False)
@@ -94,3 +91,44 @@ def test_db_load_products_fixtures_monkeypatch(monkeypatch):
     except Exception:
         expected = 0
     assert len(calls) == expected
+
+
+def test_fixtures_bootstrap_loads_fresh_db_only(tmp_path):
+    """Verify `fixtures bootstrap` fills an empty database and refuses a populated one."""
+    db_path = tmp_path / "bootstrap.db"
+
+    result = runner.invoke(cli_module.app, ["fixtures", "bootstrap", "--db", str(db_path)], catch_exceptions=False)
+    assert result.exit_code == 0, result.output
+    assert "Loaded 155 customers" in result.output
+    assert "Loaded 30 products" in result.output
+    assert "Loaded 500 invoices" in result.output
+
+    result = runner.invoke(cli_module.app, ["fixtures", "bootstrap", "--db", str(db_path)], catch_exceptions=False)
+    assert result.exit_code == 1
+    cli_module.db_manager.engine.dispose()
+
+
+def test_invoices_export_pdf(tmp_path):
+    """Verify `invoices export-pdf` writes one PDF per invoice from worker processes."""
+    from datetime import date
+
+    from sam_invoice.models.crud_invoice import invoice_crud
+
+    db_path = tmp_path / "export.db"
+    cli_module.db_manager.set_database_path(db_path)
+    cli_module.db_manager.init_db()
+    items = [{"product_name": "Wine Bottle", "quantity": 1, "unit_price": 15.0, "total_price": 15.0}]
+    for n in range(2):
+        invoice_crud.create(reference=f"EXP-{n}", date=date.today(), customer_name="PDF Client", items_data=items)
+
+    out_dir = tmp_path / "pdf"
+    result = runner.invoke(
+        cli_module.app,
+        ["invoices", "export-pdf", str(out_dir), "--db", str(db_path), "--workers", "2"],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0, result.output
+    assert "Exported 2 invoices" in result.output
+    assert sorted(path.name for path in out_dir.iterdir()) == ["EXP-0.pdf", "EXP-1.pdf"]
+    assert all(path.read_bytes().startswith(b"%PDF") for path in out_dir.iterdir())
+    cli_module.db_manager.engine.dispose()
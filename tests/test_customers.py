@@ -83,6 +83,28 @@ def test_search_customers_sorted(in_memory_db):
     assert [n.lower() for n in names2] == sorted([n.lower() for n in names2])
 
 
+def test_search_rows_matches_search(in_memory_db):
+    """`search_rows` returns the same customers as `search`, as plain column rows."""
+    customer_crud.create("zeta", "Addr 1", "z@example.com")
+    customer_crud.create("Alpha", "Addr 2", "a@example.com")
+    customer_crud.create("beta", "Addr 3", "b@example.com")
+
+    for query in ("", "a", "EXAMPLE"):
+        rows = customer_crud.search_rows(query, limit=2)
+        entities = customer_crud.search(query, limit=2)
+        assert [(r.id, r.name, r.address, r.email) for r in rows] == [
+            (c.id, c.name, c.address, c.email) for c in entities
+        ]
+
+
+def test_count_customers(in_memory_db):
+    """`count` returns the number of customers without loading them."""
+    assert customer_crud.count() == 0
+    customer_crud.create("Dupont", "1 rue du Vin", "dupont@example.com")
+    customer_crud.create("Martin", "2 avenue des Vignes", "martin@wine.com")
+    assert customer_crud.count() == 2
+
+
 def test_db_constraints_empty_name(in_memory_db):
     """Creating a customer with an empty name should violate DB constraints."""
     with pytest.raises(IntegrityError):
@@ -0,0 +1,29 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from sam_invoice.models.database import DatabaseManager
+
+
+def test_open_existing_database_without_create(tmp_path):
+    """Verify `create=False` opens a database file that already exists."""
+    db_path = tmp_path / "existing.db"
+    manager = DatabaseManager(db_path)
+    manager.init_db()
+
+    reopened = DatabaseManager()
+    reopened.set_database_path(db_path, create=False)
+    assert reopened.db_path == db_path
+    with reopened.get_session() as session:
+        assert session.connection() is not None
+
+
+def test_missing_database_without_create_raises(tmp_path):
+    """Verify `create=False` fails on a missing file without creating it or dropping the current database."""
+    current = tmp_path / "current.db"
+    manager = DatabaseManager(current)
+    missing = tmp_path / "gone" / "missing.db"
+
+    with pytest.raises(OperationalError):
+        manager.set_database_path(missing, create=False)
+    assert not missing.exists()
+    assert manager.db_path == current
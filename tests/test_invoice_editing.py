@@ -91,3 +91,27 @@ def test_invoice_editing_workflow(in_memory_db):
     assert custom_item.product_id is None
 
     assert "Custom Item" not in items_map  # Should be removed
+
+
+def test_invoice_update_keeps_matched_items(in_memory_db):
+    """Items passed back with their `id` are updated in place, others replaced."""
+    items_data = [
+        {"product_name": name, "quantity": 1, "unit_price": 10.0, "total_price": 10.0} for name in ("A", "B", "C")
+    ]
+    invoice = invoice_crud.create(
+        reference="INV-MERGE-001", date=date.today(), customer_name="Client", items_data=items_data
+    )
+    item_a, _item_b, item_c = invoice.items
+
+    new_items_data = [
+        {"id": item_a.id, "product_name": "A", "quantity": 4, "unit_price": 10.0, "total_price": 40.0},
+        {"id": item_c.id, "product_name": "C", "quantity": 1, "unit_price": 10.0, "total_price": 10.0},
+        {"product_name": "D", "quantity": 2, "unit_price": 5.0, "total_price": 10.0},
+    ]
+    updated = invoice_crud.update(invoice_id=invoice.id, items_data=new_items_data)
+
+    items_map = {item.product_name: item for item in updated.items}
+    assert sorted(items_map) == ["A", "C", "D"]
+    assert items_map["A"].id == item_a.id
+    assert items_map["A"].quantity == 4
+    assert items_map["C"].id == item_c.id
@@ -1,5 +1,8 @@
 from datetime import date
 
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
 from sam_invoice.models.crud_customer import customer_crud
 from sam_invoice.models.crud_invoice import invoice_crud
 
@@ -46,6 +49,19 @@ def test_search_invoices(in_memory_db):
     assert len(results) == 2
 
 
+def test_invoice_items_loaded_on_request_only(in_memory_db):
+    """Verify listing invoices skips the items query, fetching one loads them."""
+    items = [{"product_name": "Item 1", "quantity": 1, "unit_price": 10.0, "total_price": 10.0}]
+    inv = invoice_crud.create(reference="INV-A", date=date.today(), customer_name="Alice", items_data=items)
+
+    listed = invoice_crud.search("INV")[0]
+    with pytest.raises(InvalidRequestError):
+        _ = listed.items
+
+    fetched = invoice_crud.get_by_id(inv.id)
+    assert [item.product_name for item in fetched.items] == ["Item 1"]
+
+
 def test_update_invoice(in_memory_db):
     """Verify update functionality."""
     inv = invoice_crud.create(reference="INV-UPD", date=date.today(), customer_name="Original", items_data=[])
@@ -109,3 +125,34 @@ def test_get_invoices_for_customer(in_memory_db):
     # Test with None
     invoices_none = invoice_crud.get_for_customer(None)
     assert len(invoices_none) == 0
+
+
+def test_get_invoices_for_customers(in_memory_db):
+    """Verify get_for_customers groups the invoices of several customers."""
+    cust1 = customer_crud.create(name="Alice Martin", address="123 Main St", email="alice@example.com")
+    cust2 = customer_crud.create(name="Bob Smith", address="456 Oak Ave", email="bob@example.com")
+    invoice_crud.create(
+        reference="INV-001", date=date(2024, 1, 10), customer_id=cust1.id, customer_name="Alice", items_data=[]
+    )
+    invoice_crud.create(
+        reference="INV-002", date=date(2024, 1, 20), customer_id=cust1.id, customer_name="Alice", items_data=[]
+    )
+    invoice_crud.create(
+        reference="INV-003", date=date(2024, 2, 15), customer_id=cust2.id, customer_name="Bob", items_data=[]
+    )
+
+    invoices = invoice_crud.get_for_customers([cust1.id, cust2.id, 999])
+    assert [inv.reference for inv in invoices[cust1.id]] == ["INV-002", "INV-001"]
+    assert [inv.reference for inv in invoices[cust2.id]] == ["INV-003"]
+    assert invoices[999] == []
+    assert invoice_crud.get_for_customers([]) == {}
+
+
+def test_get_references_by_prefix(in_memory_db):
+    """Verify get_references returns only the references with the prefix."""
+    invoice_crud.create(reference="INV-2024-001", date=date.today(), customer_name="Alice", items_data=[])
+    invoice_crud.create(reference="INV-2024-002", date=date.today(), customer_name="Bob", items_data=[])
+    invoice_crud.create(reference="INV-2023-009", date=date.today(), customer_name="Carol", items_data=[])
+
+    assert sorted(invoice_crud.get_references("INV-2024-")) == ["INV-2024-001", "INV-2024-002"]
+    assert invoice_crud.get_references("INV-1999-") == []
@@ -41,3 +41,23 @@ def test_pdf_generation(in_memory_db):
     finally:
         if tmp_path.exists():
             tmp_path.unlink()
+
+
+def test_pdf_generation_many(in_memory_db, tmp_path):
+    """Verify generate_many writes all invoices into one PDF, one page each."""
+    invoices = [
+        invoice_crud.create(
+            reference=f"PDF-{n}",
+            date=date.today(),
+            customer_name="PDF Client",
+            items_data=[{"product_name": "Wine Bottle", "quantity": 1, "unit_price": 15.0, "total_price": 15.0}],
+        )
+        for n in range(3)
+    ]
+    output_path = tmp_path / "invoices.pdf"
+
+    InvoicePDFGenerator(output_path).generate_many(invoices)
+
+    content = output_path.read_bytes()
+    assert content.startswith(b"%PDF")
+    assert b"/Count 3" in content
@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QThread  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from sam_invoice.models.crud_product import product_crud  # noqa: E402
+
+
+@pytest.fixture
+def products_view(in_memory_db, monkeypatch):
+    """Provide a ProductsView whose search worker runs synchronously on the test thread."""
+    _ = QApplication.instance() or QApplication([])
+    monkeypatch.setattr("sam_invoice.ui.base_widgets.get_search_thread", QThread.currentThread)
+
+    from sam_invoice.ui.products_view import ProductsView
+
+    view = ProductsView()
+    yield view
+    view.deleteLater()
+
+
+def test_reselect_after_empty_search_enables_delete(products_view):
+    """Verify Delete is enabled again when a search with no match is followed by the same product."""
+    product_crud.create(reference="P-001", name="Chasselas", price=12.5, stock=10, sold=0)
+    products_view.reload_items()
+    detail = products_view._detail_widget
+    assert detail._delete_btn.isEnabled()
+
+    # A search with no match greys out Delete but keeps the product displayed
+    products_view.search_box.setText("no such product")
+    products_view._perform_search()
+    assert products_view._results_model.rowCount() == 0
+    assert not detail._delete_btn.isEnabled()
+
+    # Searching again selects the same, unchanged product
+    products_view.search_box.setText("Chasselas")
+    products_view._perform_search()
+    assert products_view._results_model.rowCount() == 1
+    assert detail._fields["name"][0].text() == "Chasselas"
+    assert detail._delete_btn.isEnabled()
@@ -0,0 +1,27 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from sam_invoice.ui import widget_helpers  # noqa: E402
+from sam_invoice.ui.widget_helpers import SearchWorker  # noqa: E402
+
+
+def test_search_thread_restart_accepts_searches():
+    """Verify a search thread started after a shutdown runs searches again."""
+    _ = QApplication.instance() or QApplication([])
+    widget_helpers.get_search_thread()
+    widget_helpers._stop_search_thread()
+    assert SearchWorker._shutdown
+
+    thread = widget_helpers.get_search_thread()
+    try:
+        assert thread.isRunning()
+        worker = SearchWorker(lambda q, limit: [q] * limit)
+        results = []
+        worker.results_ready.connect(results.append)
+        worker.search("wine", 2, 1)
+        assert results == [(1, ["wine", "wine"])]
+    finally:
+        widget_helpers._stop_search_thread()